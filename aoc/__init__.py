@@ -0,0 +1 @@
+"""Tooling for running the Advent of Code 2022 solutions"""
@@ -0,0 +1,11 @@
+"""Entry point for `python -m aoc` (or `python path/to/aoc`)"""
+import sys
+from pathlib import Path
+
+if not __package__:  # Executed as a directory, not as a module
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.cli import main  # noqa: E402
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Solve many input files of a single day in a pool of warm workers"""
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence
+
+from aoc.cache import ParsedInputCache
+from aoc.days import PARTS, Day
+from aoc.runner import solve_file
+
+_worker_day: Optional[Day] = None
+_worker_cache: Optional[ParsedInputCache] = None
+
+
+def expand_inputs(patterns: Sequence[str]) -> List[Path]:
+    """Files matching the given paths, directories (all files) or globs"""
+    paths = []
+
+    for pattern in patterns:
+        path = Path(pattern)
+
+        if path.is_dir():
+            paths.extend(p for p in sorted(path.iterdir()) if p.is_file())
+        elif path.is_file():
+            paths.append(path)
+        else:
+            paths.extend(
+                Path(p)
+                for p in sorted(glob.glob(pattern, recursive=True))
+                if os.path.isfile(p)
+            )
+
+    return paths
+
+
+def _init_worker(day: Day, cache: Optional[ParsedInputCache]):
+    """Import the day's module once per worker process"""
+    global _worker_day, _worker_cache
+
+    day.load()
+    _worker_day, _worker_cache = day, cache
+
+
+def _solve(path: Path, parts: Sequence[int]) -> Dict[str, Any]:
+    record: Dict[str, Any] = {"day": _worker_day.number, "file": str(path)}
+
+    try:
+        result = solve_file(
+            day=_worker_day,
+            path=path,
+            parts=parts,
+            cache=_worker_cache,
+        )
+    except Exception as err:  # A broken input must not stop the batch
+        record["error"] = f"{type(err).__name__}: {err}"
+        return record
+
+    record["answers"] = {str(p): a for p, a in result.answers.items()}
+    record["timings"] = result.timings
+
+    return record
+
+
+def run_batch(
+    day: Day,
+    paths: Sequence[Path],
+    parts: Sequence[int] = PARTS,
+    max_workers: Optional[int] = None,
+    cache: Optional[ParsedInputCache] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yields one record per file, in order of completion"""
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(day, cache),
+    ) as pool:
+        futures = [pool.submit(_solve, path, parts) for path in paths]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def write_jsonl(records: Iterator[Dict[str, Any]], fout: IO[str]) -> int:
+    """Stream records as JSON lines; returns the number of failed files"""
+    num_errors = 0
+
+    for record in records:
+        fout.write(json.dumps(record, default=str) + "\n")
+        fout.flush()
+        num_errors += "error" in record
+
+    return num_errors
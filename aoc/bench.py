@@ -0,0 +1,231 @@
+"""Benchmark suite timing `read_data` and each part separately"""
+import json
+import math
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from aoc import generators
+from aoc.days import (
+    PARTS,
+    ROOT_DIR,
+    SOLVERS,
+    Day,
+    part_kwargs,
+    select_days,
+    select_files,
+    solver_variants,
+)
+from aoc.runner import format_duration, stage_name
+
+GENERATED_DIR = ROOT_DIR / ".aoc_generated"
+
+Stats = Dict[str, Any]
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(timings: List[float]) -> Stats:
+    return {
+        "median": statistics.median(timings),
+        "p95": percentile(timings, 95),
+        "min": min(timings),
+        "max": max(timings),
+        "runs": timings,
+    }
+
+
+def measure_peak_memory(fn: Callable[[], Any]) -> int:
+    """Peak size (in bytes) of Python allocations made by `fn`"""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def benchmark_stage(
+    setup: Callable[[], Any],
+    stage: Callable[[Any], Any],
+    warmup: int,
+    repeat: int,
+) -> Stats:
+    """Time `stage(setup())` without including the cost of `setup`"""
+    timings = []
+
+    for idx in range(warmup + repeat):
+        arg = setup()
+
+        start = time.perf_counter()
+        stage(arg)
+        duration = time.perf_counter() - start
+
+        if idx >= warmup:
+            timings.append(duration)
+
+    stats = summarize(timings)
+
+    arg = setup()
+    stats["peak_memory"] = measure_peak_memory(lambda: stage(arg))
+
+    return stats
+
+
+def benchmark_file(
+    day: Day,
+    path: Path,
+    parts: Sequence[int] = PARTS,
+    warmup: int = 1,
+    repeat: int = 5,
+    variants: bool = False,
+) -> Dict[str, Stats]:
+    module = day.load()
+
+    results = {
+        "read_data": benchmark_stage(
+            setup=lambda: str(path),
+            stage=module.read_data,
+            warmup=warmup,
+            repeat=repeat,
+        ),
+    }
+
+    for part in parts:
+        solver = getattr(module, SOLVERS[part])
+        kwargs = part_kwargs(module, path, part)
+
+        results[stage_name(part)] = benchmark_stage(
+            # Solvers may modify their input, hence a fresh copy for each run
+            setup=lambda: module.read_data(str(path)),
+            stage=lambda data: solver(data, **kwargs),
+            warmup=warmup,
+            repeat=repeat,
+        )
+
+        if not variants:
+            continue
+
+        for name, variant in solver_variants(module, part).items():
+            results[f"{stage_name(part)}[{name}]"] = benchmark_stage(
+                setup=lambda: module.read_data(str(path)),
+                stage=lambda data: variant(data, **kwargs),
+                warmup=warmup,
+                repeat=repeat,
+            )
+
+    return results
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    days: Optional[Sequence[int]] = None,
+    parts: Sequence[int] = PARTS,
+    files: Optional[Sequence[str]] = None,
+    warmup: int = 1,
+    repeat: int = 5,
+    scales: Optional[Sequence[int]] = None,
+    seed: int = 0,
+    verbose: bool = True,
+    variants: bool = False,
+) -> Dict[str, Any]:
+    """Benchmark the bundled data files or, given `scales`, generated ones"""
+    results: Dict[str, Dict[str, Dict[str, Stats]]] = {}
+
+    for day in select_days(days):
+        if scales:
+            paths = [
+                generators.ensure_input(
+                    day=day.number,
+                    scale=scale,
+                    seed=seed,
+                    directory=GENERATED_DIR,
+                )
+                for scale in scales
+            ]
+        else:
+            paths = select_files(day, files)
+
+        for path in paths:
+            stats = benchmark_file(
+                day=day,
+                path=path,
+                parts=parts,
+                warmup=warmup,
+                repeat=repeat,
+                variants=variants,
+            )
+            results.setdefault(day.name, {})[path.name] = stats
+
+            if verbose:
+                print(format_file_stats(day, path, stats))
+
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "warmup": warmup,
+            "repeat": repeat,
+            "scales": list(scales) if scales else None,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def format_file_stats(day: Day, path: Path, stats: Dict[str, Stats]) -> str:
+    lines = [f"File: {path.relative_to(ROOT_DIR)}"]
+
+    for stage, stage_stats in stats.items():
+        line = (
+            f"* {stage:<14} "
+            f"median: {format_duration(stage_stats['median']):>10}  "
+            f"p95: {format_duration(stage_stats['p95']):>10}  "
+            f"peak memory: {stage_stats['peak_memory'] / 1024:,.0f} KiB"
+        )
+
+        # Variant stages (`part_one[name]`) are compared to the default solver
+        base_stats = stats.get(stage.partition("[")[0])
+        if base_stats is not stage_stats and base_stats is not None:
+            speedup = base_stats["median"] / stage_stats["median"]
+            line += f"  speedup: {speedup:.2f}x"
+
+        lines.append(line)
+
+    return "\n".join(lines) + "\n"
+
+
+def save_report(report: Dict[str, Any], path: Path):
+    with open(path, "w") as fout:
+        json.dump(report, fout, indent=2, sort_keys=True)
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    with open(path, "r") as fin:
+        return json.load(fin)
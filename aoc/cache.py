@@ -0,0 +1,127 @@
+"""Opt-in on-disk cache of parsed inputs
+
+Entries are keyed by the SHA-256 of the input file and a parser version,
+which hashes the day's module source together with the shared input
+helpers of `aoc/inputs.py`, so editing a parser (or the helpers it reads
+its lines with) invalidates its entries. Parsed data is stored as a
+pickle (protocol 5); once the cache grows past its size limit the least
+recently used entries are evicted.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict
+
+from aoc import inputs
+from aoc.days import ROOT_DIR
+
+CACHE_DIR = ROOT_DIR / ".aoc_cache"
+DEFAULT_SIZE_LIMIT = 512 * 1024 * 1024
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as fin:
+        for chunk in iter(lambda: fin.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class ParsedInputCache:
+
+    def __init__(
+        self,
+        directory: Path = CACHE_DIR,
+        size_limit: int = DEFAULT_SIZE_LIMIT,
+    ):
+        self.directory = Path(directory)
+        self.size_limit = size_limit
+        self._parser_versions: Dict[str, str] = {}
+
+    def parser_version(self, module: ModuleType) -> str:
+        name = module.__name__
+
+        if name not in self._parser_versions:
+            digest = hashlib.sha256()
+            for path in (module.__file__, inputs.__file__):
+                digest.update(file_digest(Path(path)).encode())
+            self._parser_versions[name] = digest.hexdigest()
+
+        return self._parser_versions[name]
+
+    def key(self, module: ModuleType, path: Path) -> str:
+        return hashlib.sha256(
+            f"{module.__name__}:{self.parser_version(module)}:"
+            f"{file_digest(path)}".encode()
+        ).hexdigest()
+
+    def entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def read_data(self, module: ModuleType, path: Path) -> Any:
+        """Cached equivalent of `module.read_data(path)`"""
+        entry = self.entry_path(self.key(module, path))
+
+        try:
+            with open(entry, "rb") as fin:
+                data = pickle.load(fin)
+            os.utime(entry)  # Mark as recently used
+            return data
+        except FileNotFoundError:
+            pass
+        except (pickle.UnpicklingError, EOFError, AttributeError):
+            entry.unlink(missing_ok=True)  # Corrupted or stale entry
+
+        data = module.read_data(str(path))
+        self.store(entry, data)
+
+        return data
+
+    def store(self, entry: Path, data: Any):
+        try:
+            payload = pickle.dumps(data, protocol=5)
+        except RecursionError:  # E.g. very deep day07 directory trees
+            return
+
+        if len(payload) > self.size_limit:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write atomically, so concurrent workers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fout:
+            fout.write(payload)
+        os.replace(tmp_path, entry)
+
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used entries until under the size limit"""
+        entries = []
+        for entry in self.directory.glob("*.pickle"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # Evicted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total_size <= self.size_limit:
+                break
+
+            entry.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self):
+        for entry in self.directory.glob("*.pickle"):
+            entry.unlink(missing_ok=True)
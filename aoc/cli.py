@@ -0,0 +1,484 @@
+"""Command line interface of the `aoc` runner"""
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from aoc import (
+    batch,
+    bench,
+    generators,
+    parallel,
+    profiling,
+    regression,
+    runner,
+)
+from aoc.cache import DEFAULT_SIZE_LIMIT, ParsedInputCache
+from aoc.days import PARTS, UnknownDayError, select_days, select_files
+from aoc.runner import stage_name
+
+
+def add_selection_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "-d", "--days",
+        type=int,
+        nargs="+",
+        help="Day numbers to run (default: all discovered days)",
+    )
+    parser.add_argument(
+        "-p", "--parts",
+        type=int,
+        nargs="+",
+        choices=PARTS,
+        default=list(PARTS),
+        help="Puzzle parts to run (default: both)",
+    )
+    parser.add_argument(
+        "-f", "--files",
+        nargs="+",
+        help="Data files to use, e.g. `example` or `input` (default: all)",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aoc",
+        description="Advent of Code 2022 solutions runner",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Solve selected days")
+    add_selection_arguments(run_parser)
+    run_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes; each (day, part, file) unit runs "
+            "separately, longest first (0: one per CPU, default: 1)"
+        ),
+    )
+    add_cache_arguments(run_parser)
+    run_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Use single-pass `solve_stream` engines where days have one",
+    )
+    run_parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Parse the input of a single day from the standard input",
+    )
+    run_parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Report hot-path counters of each day and part",
+    )
+
+    bench_parser = commands.add_parser(
+        "bench",
+        help="Time read_data and each part separately",
+    )
+    add_selection_arguments(bench_parser)
+    add_benchmark_arguments(bench_parser)
+    bench_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=Path("bench.json"),
+        help="Where to write the JSON report (default: bench.json)",
+    )
+    bench_parser.add_argument(
+        "--variants",
+        action="store_true",
+        help="Also time the alternative solvers a day declares in VARIANTS",
+    )
+    add_scale_arguments(bench_parser)
+
+    generate_parser = commands.add_parser(
+        "generate",
+        help="Write synthetic inputs of a chosen scale",
+    )
+    generate_parser.add_argument(
+        "-d", "--days",
+        type=int,
+        nargs="+",
+        help="Day numbers to generate inputs for (default: all)",
+    )
+    add_scale_arguments(generate_parser, required=True)
+    generate_parser.add_argument(
+        "-o", "--output-dir",
+        type=Path,
+        default=Path("generated"),
+        help="Inputs go to <dir>/dayNN/scale-S-seed-N.txt (default: generated)",
+    )
+
+    profile_parser = commands.add_parser(
+        "profile",
+        help="Profile one day and part with cProfile or tracemalloc",
+    )
+    profile_parser.add_argument("day", type=int, help="Day number")
+    profile_parser.add_argument(
+        "-p", "--part",
+        type=int,
+        choices=PARTS,
+        help="Part to profile (default: profile read_data)",
+    )
+    profile_parser.add_argument(
+        "-f", "--file",
+        default="input",
+        help="Data file to use (default: input)",
+    )
+    profile_parser.add_argument(
+        "-m", "--mode",
+        choices=("cpu", "memory"),
+        default="cpu",
+        help="cProfile call times or tracemalloc allocations (default: cpu)",
+    )
+    profile_parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of functions / allocation sites to report",
+    )
+    profile_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        help="Collapsed-stack file (default: profile-dayNN-STAGE-MODE.folded)",
+    )
+
+    check_parser = commands.add_parser(
+        "check",
+        help="Fail on performance regressions or wrong example answers",
+    )
+    add_selection_arguments(check_parser)
+    add_benchmark_arguments(check_parser, repeat=3)
+    check_parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=regression.BASELINE_PATH,
+        help="Baseline benchmark report (default: baseline.json)",
+    )
+    check_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative increase of median times (default: 0.25)",
+    )
+    check_parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed relative increase of peak memory (default: 0.10)",
+    )
+    check_parser.add_argument(
+        "--min-time",
+        type=float,
+        default=1e-3,
+        help="Absolute slack in seconds for short stages (default: 0.001)",
+    )
+    check_parser.add_argument(
+        "--min-memory",
+        type=int,
+        default=64,
+        help="Absolute slack in KiB for small allocations (default: 64)",
+    )
+    check_parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Store the new measurements as the baseline instead",
+    )
+
+    batch_parser = commands.add_parser(
+        "batch",
+        help="Solve many input files of one day in a process pool",
+    )
+    batch_parser.add_argument("day", type=int, help="Day number")
+    batch_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Input files, directories or glob patterns",
+    )
+    batch_parser.add_argument(
+        "-p", "--parts",
+        type=int,
+        nargs="+",
+        choices=PARTS,
+        default=list(PARTS),
+        help="Puzzle parts to run (default: both)",
+    )
+    batch_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes (default: one per CPU)",
+    )
+    batch_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        help="JSONL file for the results (default: stdout)",
+    )
+    add_cache_arguments(batch_parser)
+
+    return parser
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse parsed inputs stored in `.aoc_cache`",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_SIZE_LIMIT // (1024 * 1024),
+        help="Size limit of the cache in MiB (default: %(default)s)",
+    )
+
+
+def get_cache(args: argparse.Namespace) -> Optional[ParsedInputCache]:
+    if not args.cache:
+        return None
+
+    return ParsedInputCache(size_limit=args.cache_size * 1024 * 1024)
+
+
+def add_scale_arguments(
+    parser: argparse.ArgumentParser,
+    required: bool = False,
+):
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        required=required,
+        help="Sizes of generated inputs (see `aoc.generators` for each day)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the input generators (default: 0)",
+    )
+
+
+def add_benchmark_arguments(
+    parser: argparse.ArgumentParser,
+    repeat: int = 5,
+):
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Untimed runs before measuring each stage (default: 1)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=repeat,
+        help="Timed runs of each stage (default: %(default)s)",
+    )
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    if args.stdin:
+        return cmd_run_stdin(args)
+
+    if args.jobs == 1:
+        results = runner.run(
+            days=args.days,
+            parts=args.parts,
+            files=args.files,
+            cache=get_cache(args),
+            collect_stats=args.stats,
+            streaming=args.stream,
+        )
+    else:
+        results = parallel.run_parallel(
+            days=args.days,
+            parts=args.parts,
+            files=args.files,
+            max_workers=args.jobs or None,
+            cache=get_cache(args),
+            collect_stats=args.stats,
+            streaming=args.stream,
+        )
+
+    parallel.save_timings(runner.print_results(results))
+    return 0
+
+
+def cmd_run_stdin(args: argparse.Namespace) -> int:
+    days = select_days(args.days)
+
+    if len(days) != 1:
+        print("Error: --stdin requires exactly one day (-d)")
+        return 2
+
+    result = runner.solve_file(
+        day=days[0],
+        path=Path("<stdin>"),
+        parts=args.parts,
+        collect_stats=args.stats,
+        stream=sys.stdin.buffer,
+        streaming=args.stream,
+    )
+    print(runner.format_result(result))
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    report = bench.run_benchmarks(
+        days=args.days,
+        parts=args.parts,
+        files=args.files,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        scales=args.scales,
+        seed=args.seed,
+        variants=args.variants,
+    )
+    bench.save_report(report, args.output)
+    print(f"Report written to: {args.output}")
+    return 0
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    for day in select_days(args.days):
+        for scale in args.scales:
+            path = generators.write_input(
+                day=day.number,
+                path=generators.generated_path(
+                    day=day.number,
+                    scale=scale,
+                    seed=args.seed,
+                    directory=args.output_dir,
+                ),
+                scale=scale,
+                seed=args.seed,
+            )
+            print(f"Generated: {path}")
+
+    return 0
+
+
+def cmd_profile(args: argparse.Namespace) -> int:
+    day, = select_days([args.day])
+    paths = select_files(day, [args.file])
+
+    if not paths:
+        print(f"Error: No data file `{args.file}` for {day.name}")
+        return 2
+
+    stage = "read_data" if args.part is None else stage_name(args.part)
+    output = args.output or Path(
+        f"profile-{day.name}-{stage}-{args.mode}.folded"
+    )
+
+    print(profiling.run_profile(
+        day=day,
+        path=paths[0],
+        part=args.part,
+        mode=args.mode,
+        output=output,
+        top=args.top,
+    ))
+    return 0
+
+
+def cmd_check(args: argparse.Namespace) -> int:
+    failures = regression.check_example_answers(days=args.days, parts=args.parts)
+    for failure in failures:
+        print(f"Wrong example answer: {failure}")
+
+    if args.update and failures:
+        print(f"Error: Not updating {args.baseline} with wrong answers")
+        return 1
+
+    report = bench.run_benchmarks(
+        days=args.days,
+        parts=args.parts,
+        files=args.files,
+        warmup=args.warmup,
+        repeat=args.repeat,
+    )
+    baseline = (
+        bench.load_report(args.baseline) if args.baseline.exists() else None
+    )
+
+    if args.update:
+        bench.save_report(
+            regression.updated_baseline(baseline, report),
+            args.baseline,
+        )
+        print(f"Baseline written to: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"Error: No baseline at {args.baseline} (use --update)")
+        return 2
+
+    regressions = regression.compare_reports(
+        baseline=baseline,
+        current=report,
+        tolerance=args.tolerance,
+        memory_tolerance=args.memory_tolerance,
+        min_time=args.min_time,
+        min_memory=args.min_memory * 1024,
+    )
+    for item in regressions:
+        print(f"Regression: {item}")
+
+    if failures or regressions:
+        return 1
+
+    print("No regressions")
+    return 0
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    day, = select_days([args.day])
+    paths = batch.expand_inputs(args.inputs)
+
+    if not paths:
+        print("Error: No input files found", file=sys.stderr)
+        return 2
+
+    records = batch.run_batch(
+        day=day,
+        paths=paths,
+        parts=args.parts,
+        max_workers=args.jobs or None,
+        cache=get_cache(args),
+    )
+
+    if args.output is None:
+        num_errors = batch.write_jsonl(records, sys.stdout)
+    else:
+        with open(args.output, "w") as fout:
+            num_errors = batch.write_jsonl(records, fout)
+
+    if num_errors:
+        print(f"{num_errors}/{len(paths)} inputs failed", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    commands = {
+        "run": cmd_run,
+        "bench": cmd_bench,
+        "generate": cmd_generate,
+        "profile": cmd_profile,
+        "check": cmd_check,
+        "batch": cmd_batch,
+    }
+
+    try:
+        return commands[args.command](args)
+    except UnknownDayError as err:
+        print(f"Error: {err}")
+        return 2
@@ -0,0 +1,111 @@
+"""Discovery and loading of the `dayNN/main.py` solution modules"""
+import importlib
+import re
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DAY_DIR_PATTERN = re.compile(r"^day(\d{2})$")
+
+PARTS = (1, 2)
+PART_NAMES = {1: "Part One", 2: "Part Two"}
+SOLVERS = {1: "solve_part_one", 2: "solve_part_two"}
+
+
+class UnknownDayError(ValueError):
+    pass
+
+
+class Day(NamedTuple):
+    number: int
+    directory: Path
+
+    @property
+    def name(self) -> str:
+        return self.directory.name
+
+    @property
+    def module_name(self) -> str:
+        return f"{self.name}.main"
+
+    def data_files(self) -> List[Path]:
+        return sorted((self.directory / "data").glob("*.txt"))
+
+    def load(self) -> ModuleType:
+        # Day directories are namespace packages living in the repo root
+        if str(ROOT_DIR) not in sys.path:
+            sys.path.insert(0, str(ROOT_DIR))
+
+        return importlib.import_module(self.module_name)
+
+
+def discover_days() -> List[Day]:
+    days = []
+
+    for directory in sorted(ROOT_DIR.iterdir()):
+        match = DAY_DIR_PATTERN.match(directory.name)
+
+        if match is None or not (directory / "main.py").is_file():
+            continue
+
+        days.append(Day(number=int(match.group(1)), directory=directory))
+
+    return days
+
+
+def select_days(numbers: Optional[Sequence[int]] = None) -> List[Day]:
+    days = discover_days()
+
+    if not numbers:
+        return days
+
+    available = {day.number: day for day in days}
+    missing = sorted(set(numbers) - set(available))
+
+    if missing:
+        raise UnknownDayError(f"No solutions for day(s): {missing}")
+
+    return [available[number] for number in sorted(set(numbers))]
+
+
+def select_files(day: Day, names: Optional[Sequence[str]] = None) -> List[Path]:
+    """Data files of a day, optionally filtered by name (`example`, `input`)"""
+    files = day.data_files()
+
+    if not names:
+        return files
+
+    return [path for path in files if path.stem in names or path.name in names]
+
+
+def part_kwargs(module: ModuleType, path: Path, part: int) -> Dict[str, Any]:
+    """Extra solver arguments for a given input (see day15 `PART_KWARGS`)"""
+    kwargs: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = getattr(
+        module, "PART_KWARGS", {}
+    )
+
+    if path.name not in kwargs:
+        return {}
+
+    return kwargs[path.name][part - 1]
+
+
+def solver_variants(module: ModuleType, part: int) -> Dict[str, Callable]:
+    """Alternative solvers of a part by variant name (see day03 `VARIANTS`)"""
+    variants: Dict[str, Tuple[str, str]] = getattr(module, "VARIANTS", {})
+
+    return {
+        name: getattr(module, solvers[part - 1])
+        for name, solvers in variants.items()
+    }
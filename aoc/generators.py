@@ -0,0 +1,526 @@
+"""Seeded generators of synthetic, arbitrarily large puzzle inputs
+
+Every generator takes a `random.Random` instance and a `scale` (its meaning
+is described in the generator's docstring) and yields the lines of a valid
+input file for the given day.
+"""
+import json
+import random
+from pathlib import Path
+from string import ascii_letters, ascii_lowercase
+from typing import Callable, Dict, Iterator, List, Tuple
+
+Generator = Callable[[random.Random, int], Iterator[str]]
+
+
+def day01(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` elves carrying 1-15 food items each"""
+    for idx in range(scale):
+        if idx > 0:
+            yield ""
+
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1_000, 60_000))
+
+
+def day02(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` rounds of the strategy guide"""
+    for _ in range(scale):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+
+
+def day03(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` rucksacks (rounded up to full groups of three elves)
+
+    Both halves of each rucksack share exactly one item type and the
+    rucksacks of each group share exactly one badge item type.
+    """
+    for _ in range((scale + 2) // 3):
+        letters = list(ascii_letters)
+        rng.shuffle(letters)
+        badge = letters[0]
+        pools = (letters[1:18], letters[18:35], letters[35:52])
+
+        for pool in pools:
+            common, first, second = pool[0], pool[1:9], pool[9:17]
+            size = rng.randint(8, 24)
+
+            halves = [
+                [common] + rng.choices(first, k=size - 1),
+                [common] + rng.choices(second, k=size - 1),
+            ]
+            rng.choice(halves)[-1] = badge
+
+            for half in halves:
+                rng.shuffle(half)
+
+            yield "".join(halves[0]) + "".join(halves[1])
+
+
+def day04(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` pairs of section assignments"""
+    for _ in range(scale):
+        ranges = []
+        for _ in range(2):
+            start = rng.randint(1, 99)
+            ranges.append(f"{start}-{rng.randint(start, 99)}")
+
+        yield ",".join(ranges)
+
+
+def day05(rng: random.Random, scale: int) -> Iterator[str]:
+    """Crate drawing of 9 stacks followed by `scale` rearrangement moves"""
+    num_stacks = 9
+    heights = [rng.randint(1, 8) for _ in range(num_stacks)]
+
+    for level in reversed(range(max(heights))):
+        yield " ".join(
+            f"[{rng.choice(ascii_letters[26:])}]" if height > level else "   "
+            for height in heights
+        ).rstrip()
+
+    yield " ".join(f" {idx} " for idx in range(1, num_stacks + 1)).rstrip()
+    yield ""
+
+    for _ in range(scale):
+        src = rng.choice([idx for idx, h in enumerate(heights) if h > 0])
+        dst = rng.choice([idx for idx in range(num_stacks) if idx != src])
+        n = rng.randint(1, heights[src])
+
+        heights[src] -= n
+        heights[dst] += n
+
+        yield f"move {n} from {src + 1} to {dst + 1}"
+
+
+def day06(rng: random.Random, scale: int) -> Iterator[str]:
+    """Signal of `scale` characters with both markers close to its end"""
+    marker = rng.sample(ascii_lowercase, k=14)
+    # Three distinct characters cannot form any marker
+    noise = rng.choices(marker[:3], k=max(scale - len(marker) - 1, 0))
+
+    yield "".join(noise + marker + marker[:1])
+
+
+def day07(rng: random.Random, scale: int) -> Iterator[str]:
+    """Terminal transcript exploring a tree of `scale` directories
+
+    File sizes are scaled so the total used space lands between 40M and 70M,
+    like the puzzle's 70M disk that must end up with 30M free.
+    """
+    children: List[List[int]] = [[] for _ in range(scale)]
+    for idx in range(1, scale):
+        children[rng.randrange(idx)].append(idx)
+
+    file_counts = [rng.randint(1 if idx == 0 else 0, 4) for idx in range(scale)]
+    weights = [rng.randint(1_000, 300_000) for _ in range(sum(file_counts))]
+
+    # Each file gets 1 plus its share of the rest, rounded on the running
+    # sums so the sizes add up to exactly `total_used`
+    total_used = rng.randint(41_000_000, 69_000_000)
+    spread = total_used - len(weights)
+    weight_sum = sum(weights)
+    sizes = []
+    cumulative = previous = 0
+    for weight in weights:
+        cumulative += weight
+        rounded = cumulative * spread // weight_sum
+        sizes.append(1 + rounded - previous)
+        previous = rounded
+    size_iter = iter(sizes)
+
+    # Iterative DFS: (directory, is_leaving)
+    stack: List[Tuple[int, bool]] = [(0, False)]
+
+    while stack:
+        idx, is_leaving = stack.pop()
+
+        if is_leaving:
+            yield "$ cd .."
+            continue
+
+        yield "$ cd /" if idx == 0 else f"$ cd d{idx}"
+        yield "$ ls"
+
+        for child in children[idx]:
+            yield f"dir d{child}"
+
+        for file_idx in range(file_counts[idx]):
+            size = next(size_iter)
+            yield f"{size} f{file_idx}.{rng.choice('abcd')}"
+
+        for child in reversed(children[idx]):
+            stack.append((child, True))
+            stack.append((child, False))
+
+
+def day08(rng: random.Random, scale: int) -> Iterator[str]:
+    """Forest of `scale` x `scale` trees"""
+    digits = "0123456789"
+    for _ in range(scale):
+        yield "".join(rng.choices(digits, k=scale))
+
+
+def day09(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` head motions"""
+    for _ in range(scale):
+        yield f"{rng.choice('UDLR')} {rng.randint(1, 20)}"
+
+
+def day10(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` instructions (at least 240, so all signal cycles exist)"""
+    for _ in range(max(scale, 240)):
+        if rng.random() < 0.4:
+            yield "noop"
+        else:
+            yield f"addx {rng.randint(-20, 20)}"
+
+
+def _primes(n: int) -> List[int]:
+    primes: List[int] = []
+    candidate = 2
+
+    while len(primes) < n:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+
+    return primes
+
+
+def day11(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` monkeys (at least 2)
+
+    Operations are limited to additions and small multiplications, as part
+    one does not reduce the worry levels modulo the divisibility factors.
+    """
+    num_monkeys = max(scale, 2)
+    factors = _primes(num_monkeys)
+    rng.shuffle(factors)
+
+    for idx in range(num_monkeys):
+        if idx > 0:
+            yield ""
+
+        items = ", ".join(
+            str(rng.randint(50, 99))
+            for _ in range(rng.randint(1, 8))
+        )
+        operation = rng.choice([
+            f"old * {rng.randint(2, 3)}",
+            f"old + {rng.randint(1, 8)}",
+            f"old + {rng.randint(1, 8)}",
+        ])
+        pos, neg = (
+            (other + (other >= idx)) % num_monkeys
+            for other in rng.choices(range(num_monkeys - 1), k=2)
+        )
+
+        yield f"Monkey {idx}:"
+        yield f"  Starting items: {items}"
+        yield f"  Operation: new = {operation}"
+        yield f"  Test: divisible by {factors[idx]}"
+        yield f"    If true: throw to monkey {pos}"
+        yield f"    If false: throw to monkey {neg}"
+
+
+def day12(rng: random.Random, scale: int) -> Iterator[str]:
+    """Heightmap `scale` columns wide (at least 26) and `scale // 4` tall
+
+    Heights rise from west to east; the row holding `S` and `E` is kept
+    free of noise, so `E` is always reachable.
+    """
+    width = max(scale, 26)
+    height = max(width // 4, 5)
+    path_row = rng.randrange(height)
+
+    for i in range(height):
+        row = []
+        for j in range(width):
+            level = j * 25 // (width - 1)
+            if i != path_row:
+                level = max(level - rng.choice((0, 0, 0, 1, 2)), 0)
+            row.append(ascii_lowercase[level])
+
+        if i == path_row:
+            row[0], row[-1] = "S", "E"
+
+        yield "".join(row)
+
+
+def _packet(rng: random.Random, depth: int = 0) -> list:
+    packet = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            packet.append(_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+    return packet
+
+
+def day13(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` pairs of packets"""
+    for idx in range(scale):
+        if idx > 0:
+            yield ""
+
+        for _ in range(2):
+            yield json.dumps(_packet(rng), separators=(",", ":"))
+
+
+def day14(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` rock paths below the sand source, deeper for larger scales"""
+    max_depth = max(int(scale ** 0.5) * 10, 20)
+
+    for _ in range(scale):
+        x = rng.randint(500 - max_depth, 500 + max_depth)
+        y = rng.randint(5, max_depth)
+        points = [(x, y)]
+
+        for segment in range(rng.randint(1, 5)):
+            length = rng.randint(1, 8)
+            if segment % 2 == 0:
+                x += rng.choice((-length, length))
+            else:
+                y = min(max(y + rng.choice((-length, length)), 5), max_depth)
+            points.append((x, y))
+
+        yield " -> ".join(f"{px},{py}" for px, py in points)
+
+
+def day15(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` sensors (at least 4) for the default puzzle parameters
+
+    Four large sensors cover the whole search area except for one hidden
+    position (in rotated coordinates each one covers a half-plane next to
+    it); the remaining sensors are random and never reach that position.
+    """
+    coordinate_max = 4_000_000
+    px, py = rng.randint(0, coordinate_max), rng.randint(0, coordinate_max)
+    u0, v0 = px + py, px - py
+    radius = coordinate_max + 1
+
+    def _from_rotated(u: int, v: int) -> Tuple[int, int]:
+        return (u + v) // 2, (u - v) // 2
+
+    def _parity(u: int, base: int) -> int:
+        return base + (u - base) % 2
+
+    sensors = []
+    for du in (-1, 1):
+        u = u0 + du * (radius + 1)
+        sensors.append((_from_rotated(u, _parity(u, 0)), radius))
+    for dv in (-1, 1):
+        v = v0 + dv * (radius + 1)
+        sensors.append((_from_rotated(_parity(v, coordinate_max), v), radius))
+
+    for _ in range(max(scale - len(sensors), 0)):
+        sx, sy = rng.randint(0, coordinate_max), rng.randint(0, coordinate_max)
+        distance = abs(sx - px) + abs(sy - py)
+        if distance < 2:
+            continue
+        sensors.append(((sx, sy), rng.randint(1, min(distance - 1, 1_000_000))))
+
+    rng.shuffle(sensors)
+
+    for (sx, sy), sensor_radius in sensors:
+        dx = rng.randint(0, sensor_radius)
+        bx = sx + rng.choice((-dx, dx))
+        by = sy + rng.choice((-1, 1)) * (sensor_radius - dx)
+
+        yield f"Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}"
+
+
+def day18(rng: random.Random, scale: int) -> Iterator[str]:
+    """About `scale` unit cubes packed into a box"""
+    side = max(round((2 * scale) ** (1 / 3)), 3)
+    cubes = set()
+
+    while len(cubes) < min(scale, side ** 3 // 2):
+        cubes.add(tuple(rng.randint(1, side) for _ in range(3)))
+
+    # The flood fill starts in the corner of the bounding box
+    while True:
+        corner = tuple(min(coords) for coords in zip(*cubes))
+        if corner not in cubes:
+            break
+        cubes.remove(corner)
+
+    for cube in cubes:
+        yield ",".join(map(str, cube))
+
+
+def day20(rng: random.Random, scale: int) -> Iterator[str]:
+    """`scale` numbers (at least 2), exactly one of which is zero"""
+    numbers = [
+        rng.choice((-1, 1)) * rng.randint(1, 10_000)
+        for _ in range(max(scale, 2) - 1)
+    ]
+    numbers.insert(rng.randrange(len(numbers) + 1), 0)
+
+    for number in numbers:
+        yield str(number)
+
+
+def _monkey_names(count: int) -> Iterator[str]:
+    length = 4
+    while 26 ** length < count + 2:
+        length += 1
+
+    idx = 0
+    while count > 0:
+        name, value = "", idx
+        for _ in range(length):
+            value, letter = divmod(value, 26)
+            name += ascii_lowercase[letter]
+
+        idx += 1
+        if name in ("root", "humn"):
+            continue
+
+        yield name
+        count -= 1
+
+
+def day21(rng: random.Random, scale: int) -> Iterator[str]:
+    """Expression tree of about `scale` monkeys
+
+    Values are fixed top-down so that every division is exact and both
+    sides of `root` are equal, hence part two recovers the original number
+    yelled by `humn`.
+    """
+    num_nodes = max(scale // 2 * 2 + 1, 7)  # Full binary tree
+    names = _monkey_names(num_nodes)
+    lines = []
+    # (name, number of nodes in subtree, value, contains `humn`)
+    stack: List[Tuple[str, int, int, bool]] = []
+
+    def _split(n: int) -> Tuple[int, int]:
+        left = max(1, round((n - 1) * rng.uniform(0.3, 0.7)))
+        left -= 1 - left % 2  # Subtrees have an odd number of nodes
+        return left, n - 1 - left
+
+    def _add_node(
+        name: str,
+        size: int,
+        op: str,
+        values: Tuple[int, int],
+        humn_child: int,
+    ):
+        children = []
+        for child, (child_size, child_value) in enumerate(
+            zip(_split(size), values)
+        ):
+            has_humn = child == humn_child
+            child_name = (
+                "humn" if has_humn and child_size == 1 else next(names)
+            )
+            children.append((child_name, child_size, child_value, has_humn))
+
+        lines.append(f"{name}: {children[0][0]} {op} {children[1][0]}")
+        stack.extend(children)
+
+    # The solver expects `humn` on the left-hand side of `root`
+    value = rng.randint(1_000, 100_000)
+    _add_node("root", num_nodes, "+", (value, value), humn_child=0)
+
+    while stack:
+        name, size, value, has_humn = stack.pop()
+
+        if size == 1:
+            lines.append(f"{name}: {value}")
+            continue
+
+        if value > 1 and rng.random() < 0.35:
+            a = rng.randint(1, value - 1)
+            op, values = "+", (a, value - a)
+        elif rng.random() < 0.4:
+            b = rng.randint(1, 100)
+            op, values = "-", (value + b, b)
+        elif rng.random() < 0.5:
+            d = rng.choice([d for d in range(2, 10) if value % d == 0] or [1])
+            op, values = "*", (value // d, d)
+        else:
+            d = rng.randint(1, 5)
+            op, values = "/", (value * d, d)
+
+        humn_child = rng.choice((0, 1)) if has_humn else -1
+        _add_node(name, size, op, values, humn_child)
+
+    rng.shuffle(lines)
+    yield from lines
+
+
+def day22(rng: random.Random, scale: int) -> Iterator[str]:
+    """Board of roughly `scale` x `scale` tiles and `4 * scale` instructions"""
+    side = max(scale, 4)
+
+    for i in range(side):
+        offset = rng.randint(0, side // 4) if i > 0 else 0
+        row = [
+            "#" if rng.random() < 0.1 else "."
+            for _ in range(rng.randint(side // 2, side))
+        ]
+        if i == 0:
+            row[0] = "."
+        yield " " * offset + "".join(row)
+
+    yield ""
+
+    path = [str(rng.randint(1, side))]
+    for _ in range(4 * side - 1):
+        path.append(rng.choice("LR"))
+        path.append(str(rng.randint(1, side)))
+
+    yield "".join(path)
+
+
+GENERATORS: Dict[int, Generator] = {
+    1: day01,
+    2: day02,
+    3: day03,
+    4: day04,
+    5: day05,
+    6: day06,
+    7: day07,
+    8: day08,
+    9: day09,
+    10: day10,
+    11: day11,
+    12: day12,
+    13: day13,
+    14: day14,
+    15: day15,
+    18: day18,
+    20: day20,
+    21: day21,
+    22: day22,
+}
+
+
+def generated_path(day: int, scale: int, seed: int, directory: Path) -> Path:
+    return directory / f"day{day:02d}" / f"scale-{scale}-seed-{seed}.txt"
+
+
+def write_input(day: int, path: Path, scale: int, seed: int = 0) -> Path:
+    """Write a generated input for `day`, without a trailing newline"""
+    rng = random.Random(f"day{day:02d}-{scale}-{seed}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "w") as fout:
+        for idx, line in enumerate(GENERATORS[day](rng, scale)):
+            if idx > 0:
+                fout.write("\n")
+            fout.write(line)
+
+    return path
+
+
+def ensure_input(day: int, scale: int, seed: int, directory: Path) -> Path:
+    """Generate an input unless it already exists (generation is seeded)"""
+    path = generated_path(day=day, scale=scale, seed=seed, directory=directory)
+
+    if not path.exists():
+        write_input(day=day, path=path, scale=scale, seed=seed)
+
+    return path
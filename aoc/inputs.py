@@ -0,0 +1,19 @@
+"""Input helpers shared by the `dayNN/main.py` solution modules
+
+Days import this module even when run as a script (`cd day01 && python
+main.py`), by putting the repo root on `sys.path` first.
+"""
+import os
+from typing import Iterable, Iterator, Union
+
+Source = Union[str, os.PathLike, Iterable[str], Iterable[bytes]]
+
+
+def iter_lines(source: Source) -> Iterator[str]:
+    """Lines of a file path, a text/binary stream or any iterable of lines"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r") as fin:
+            yield from fin
+    else:
+        for line in source:
+            yield line.decode() if isinstance(line, bytes) else line
@@ -0,0 +1,132 @@
+"""Parallel execution of independent (day, part, data file) units"""
+import json
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from aoc.cache import ParsedInputCache
+from aoc.days import PARTS, ROOT_DIR, Day, select_days, select_files
+from aoc.runner import RunResult, solve_file, stage_name
+
+TIMINGS_PATH = ROOT_DIR / ".aoc_timings.json"
+
+
+class Unit(NamedTuple):
+    day: Day
+    part: int
+    path: Path
+
+    @property
+    def key(self) -> str:
+        return f"{self.path.relative_to(ROOT_DIR)}:{self.part}"
+
+
+def load_timings(path: Path = TIMINGS_PATH) -> Dict[str, float]:
+    try:
+        with open(path, "r") as fin:
+            return json.load(fin)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_timings(results: Iterable[RunResult], path: Path = TIMINGS_PATH):
+    """Remember how long each unit took (parsing included) for scheduling"""
+    timings = load_timings(path)
+
+    for result in results:
+        if "read_data" not in result.timings:  # Streaming solvers
+            continue
+
+        for part in result.answers:
+            key = f"{result.path.relative_to(ROOT_DIR)}:{part}"
+            timings[key] = (
+                result.timings["read_data"] + result.timings[stage_name(part)]
+            )
+
+    with open(path, "w") as fout:
+        json.dump(timings, fout, indent=2, sort_keys=True)
+
+
+def schedule(units: List[Unit], timings: Dict[str, float]) -> List[Unit]:
+    """Longest job first; units never seen before are assumed to be slow"""
+    return sorted(
+        units,
+        key=lambda unit: timings.get(unit.key, float("inf")),
+        reverse=True,
+    )
+
+
+def _solve_unit(
+    unit: Unit,
+    cache: Optional[ParsedInputCache],
+    collect_stats: bool,
+    streaming: bool,
+) -> RunResult:
+    return solve_file(
+        day=unit.day,
+        path=unit.path,
+        parts=(unit.part,),
+        cache=cache,
+        collect_stats=collect_stats,
+        streaming=streaming,
+    )
+
+
+def merge_results(results: Sequence[RunResult]) -> RunResult:
+    """Combine single-part results of the same file into one"""
+    answers = {}
+    timings: Dict[str, float] = {}
+    counters = {}
+
+    for result in results:
+        answers.update(result.answers)
+        counters.update(result.counters)  # Parsing counters are the same
+        for stage, duration in result.timings.items():
+            timings[stage] = min(timings.get(stage, duration), duration)
+
+    return RunResult(
+        day=results[0].day,
+        path=results[0].path,
+        answers=answers,
+        timings=timings,
+        counters=counters,
+    )
+
+
+def run_parallel(
+    days: Optional[Sequence[int]] = None,
+    parts: Sequence[int] = PARTS,
+    files: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None,
+    cache: Optional[ParsedInputCache] = None,
+    collect_stats: bool = False,
+    streaming: bool = False,
+) -> Iterator[RunResult]:
+    """Yields results in (day, file) order, regardless of completion order"""
+    units = [
+        Unit(day=day, part=part, path=path)
+        for day in select_days(days)
+        for path in select_files(day, files)
+        for part in parts
+    ]
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        futures: Dict[Unit, Future] = {
+            unit: pool.submit(
+                _solve_unit, unit, cache, collect_stats, streaming
+            )
+            for unit in schedule(units, load_timings())
+        }
+
+        for idx in range(0, len(units), len(parts)):
+            file_units = units[idx:idx + len(parts)]
+            yield merge_results([futures[unit].result() for unit in file_units])
@@ -0,0 +1,232 @@
+"""cProfile / tracemalloc profiling of a single day and stage
+
+Both modes write a collapsed-stack file (`frame;frame;frame value` per
+line), as read by `flamegraph.pl`, speedscope or inferno.
+"""
+import cProfile
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aoc.days import SOLVERS, Day, part_kwargs
+
+FunctionKey = Tuple[str, int, str]  # As used by `pstats`
+
+MAX_STACK_DEPTH = 64
+
+
+def stage_callable(day: Day, path: Path, part: Optional[int]) -> Callable:
+    """`read_data` when `part` is None, otherwise the part's solver"""
+    module = day.load()
+
+    if part is None:
+        return partial(module.read_data, str(path))
+
+    data = module.read_data(str(path))
+    solver = getattr(module, SOLVERS[part])
+
+    return partial(solver, data, **part_kwargs(module, path, part))
+
+
+def _short_path(filename: str) -> str:
+    """`day18/main.py` rather than just `main.py`"""
+    directory, name = os.path.split(filename)
+    return os.path.join(os.path.basename(directory), name)
+
+
+def _frame_label(func: FunctionKey) -> str:
+    filename, lineno, name = func
+    if filename == "~":  # Built-in function
+        return name
+
+    return f"{name} ({_short_path(filename)}:{lineno})"
+
+
+def collapse_cprofile(stats: pstats.Stats) -> Dict[str, float]:
+    """Approximate collapsed stacks (in µs) from the cProfile call graph
+
+    cProfile only records caller -> callee edges, so the self time of a
+    function is split among its call paths proportionally to the time
+    spent on each incoming edge. Recursive edges are not unrolled.
+    """
+    raw: Dict[FunctionKey, Any] = stats.stats  # type: ignore[attr-defined]
+
+    callees: Dict[FunctionKey, List[Tuple[FunctionKey, float]]] = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, (_, _, _, edge_cumtime) in callers.items():
+            callees.setdefault(caller, []).append((func, edge_cumtime))
+
+    roots = [
+        func
+        for func, (_, _, _, _, callers) in raw.items()
+        if not any(caller in raw for caller in callers)
+        and "_lsprof" not in func[2]  # Profiler.disable()
+    ]
+
+    stacks: Dict[str, float] = {}
+
+    def _walk(func: FunctionKey, path: List[FunctionKey], share: float):
+        _, _, tottime, cumtime, _ = raw[func]
+        path = path + [func]
+
+        self_time = tottime * share * 1e6
+        if self_time > 0:
+            key = ";".join(_frame_label(f) for f in path)
+            stacks[key] = stacks.get(key, 0) + self_time
+
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+
+        for callee, edge_cumtime in callees.get(func, []):
+            if callee in path or raw[callee][3] == 0:
+                continue
+            _walk(callee, path, share * edge_cumtime / raw[callee][3])
+
+    for root in roots:
+        _walk(root, [], 1.0)
+
+    return stacks
+
+
+def profile_cpu(fn: Callable, top: int = 20) -> Tuple[Dict[str, float], str]:
+    profiler = cProfile.Profile()
+    profiler.runcall(fn)
+
+    stats = pstats.Stats(profiler)
+    stacks = collapse_cprofile(stats)
+
+    rows = sorted(
+        stats.stats.items(),  # type: ignore[attr-defined]
+        key=lambda item: item[1][3],
+        reverse=True,
+    )[:top]
+    report = [f"{'cumtime':>10} {'tottime':>10} {'ncalls':>10}  function"]
+    for func, (_, ncalls, tottime, cumtime, _) in rows:
+        report.append(
+            f"{cumtime:>10.4f} {tottime:>10.4f} {ncalls:>10}  "
+            f"{_frame_label(func)}"
+        )
+
+    return stacks, "\n".join(report)
+
+
+def _largest_snapshot(
+    fn: Callable,
+    interval: float,
+) -> Tuple[tracemalloc.Snapshot, int]:
+    """Run `fn`, keeping the snapshot taken at the highest traced size"""
+    best: Dict[str, Any] = {"size": -1, "snapshot": None}
+    done = threading.Event()
+
+    def _sample():
+        while not done.wait(interval):
+            if not tracemalloc.is_tracing():
+                continue
+
+            current, _ = tracemalloc.get_traced_memory()
+            if current > best["size"]:
+                best["size"] = current
+                best["snapshot"] = tracemalloc.take_snapshot()
+
+    sampler = threading.Thread(target=_sample, daemon=True)
+    sampler.start()
+
+    tracemalloc.start(MAX_STACK_DEPTH)
+    try:
+        result = fn()  # Keep the result alive for the final snapshot
+        done.set()
+        sampler.join()
+
+        current, peak = tracemalloc.get_traced_memory()
+        if current > best["size"]:
+            best["snapshot"] = tracemalloc.take_snapshot()
+        del result
+    finally:
+        done.set()
+        tracemalloc.stop()
+
+    return best["snapshot"], peak
+
+
+def _stage_frames(
+    traceback: tracemalloc.Traceback,
+) -> List[tracemalloc.Frame]:
+    """Frames below the call of the profiled stage (outermost first)"""
+    frames = list(traceback)
+
+    for idx in reversed(range(len(frames))):
+        if frames[idx].filename == __file__:
+            return frames[idx + 1:]
+
+    return frames
+
+
+def profile_memory(
+    fn: Callable,
+    top: int = 20,
+    interval: float = 0.05,
+) -> Tuple[Dict[str, float], str]:
+    """Allocations (in bytes) alive at the largest sampled heap size"""
+    snapshot, peak = _largest_snapshot(fn, interval=interval)
+    # Skip allocations of the sampler itself
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__, all_frames=True),
+        tracemalloc.Filter(False, threading.__file__, all_frames=True),
+    ])
+
+    stacks: Dict[str, float] = {}
+    for stat in snapshot.statistics("traceback"):
+        frames = _stage_frames(stat.traceback)
+        if not frames:
+            continue
+
+        key = ";".join(
+            f"{_short_path(frame.filename)}:{frame.lineno}"
+            for frame in frames
+        )
+        stacks[key] = stacks.get(key, 0) + stat.size
+
+    report = [f"Peak traced memory: {peak / 1024:,.1f} KiB", ""]
+    report.append(f"{'size (KiB)':>12} {'blocks':>10}  allocation site")
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        report.append(
+            f"{stat.size / 1024:>12,.1f} {stat.count:>10}  "
+            f"{frame.filename}:{frame.lineno}"
+        )
+
+    return stacks, "\n".join(report)
+
+
+def write_collapsed(stacks: Dict[str, float], path: Path):
+    with open(path, "w") as fout:
+        for stack, value in sorted(stacks.items()):
+            if round(value) > 0:
+                fout.write(f"{stack} {round(value)}\n")
+
+
+def run_profile(
+    day: Day,
+    path: Path,
+    part: Optional[int],
+    mode: str,
+    output: Path,
+    top: int = 20,
+) -> str:
+    fn = stage_callable(day=day, path=path, part=part)
+
+    start = time.perf_counter()
+    if mode == "cpu":
+        stacks, report = profile_cpu(fn, top=top)
+    else:
+        stacks, report = profile_memory(fn, top=top)
+    duration = time.perf_counter() - start
+
+    write_collapsed(stacks, output)
+
+    return f"{report}\n\nProfiled in {duration:.2f} s, stacks: {output}"
@@ -0,0 +1,301 @@
+"""Performance regression gate against a stored benchmark baseline"""
+import ast
+import copy
+import inspect
+from types import ModuleType
+from typing import (
+    Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple,
+)
+
+from aoc.days import PARTS, ROOT_DIR, SOLVERS, select_days
+from aoc.runner import format_duration, solve_file
+
+BASELINE_PATH = ROOT_DIR / "baseline.json"
+
+ANSWER_NAMES = {"solution_one": 1, "solution_two": 2}
+SOLVER_PARTS = {solver: part for part, solver in SOLVERS.items()}
+
+
+class Regression(NamedTuple):
+    entry: str
+    metric: str
+    baseline: float
+    current: float
+    limit: float
+
+    def __str__(self) -> str:
+        if self.metric == "median":
+            values = (
+                format_duration(self.baseline),
+                format_duration(self.current),
+                format_duration(self.limit),
+            )
+        else:
+            values = tuple(
+                f"{value / 1024:,.0f} KiB"
+                for value in (self.baseline, self.current, self.limit)
+            )
+
+        return (
+            f"{self.entry} [{self.metric}]: {values[0]} -> {values[1]} "
+            f"(limit: {values[2]})"
+        )
+
+
+class ExampleCall(NamedTuple):
+    """`assert function(*args, **kwargs) == expected` found in a `main()`"""
+    function: str
+    args: tuple
+    kwargs: Dict[str, Any]
+    expected: Any
+
+    def __str__(self) -> str:
+        arguments = [repr(arg) for arg in self.args] + [
+            f"{name}={value!r}" for name, value in self.kwargs.items()
+        ]
+
+        return f"{self.function}({', '.join(arguments)})"
+
+
+def _main_asserts(module: ModuleType) -> Iterator[Tuple[ast.Compare, dict]]:
+    """`x == y` asserts of `main()`, with the literals assigned before them"""
+    tree = ast.parse(inspect.getsource(module))
+
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.FunctionDef) and node.name == "main"):
+            continue
+
+        local_literals: Dict[str, Any] = {}
+        statements = sorted(
+            (
+                statement
+                for statement in ast.walk(node)
+                if isinstance(statement, (ast.Assign, ast.Assert))
+            ),
+            key=lambda statement: statement.lineno,
+        )
+
+        for statement in statements:
+            if isinstance(statement, ast.Assign):
+                for target in statement.targets:
+                    if not isinstance(target, ast.Name):
+                        continue
+                    try:
+                        local_literals[target.id] = ast.literal_eval(
+                            statement.value
+                        )
+                    except ValueError:  # Not a literal
+                        local_literals.pop(target.id, None)
+            elif (
+                isinstance(statement.test, ast.Compare)
+                and len(statement.test.ops) == 1
+                and isinstance(statement.test.ops[0], ast.Eq)
+            ):
+                yield statement.test, dict(local_literals)
+
+
+def _literal(node: ast.expr, local_literals: Dict[str, Any]) -> Any:
+    """Value of a literal or of a name bound to one (ValueError otherwise)"""
+    if isinstance(node, ast.Name):
+        if node.id not in local_literals:
+            raise ValueError(node.id)
+        return local_literals[node.id]
+
+    return ast.literal_eval(node)
+
+
+def _asserted_part(node: ast.expr) -> Optional[int]:
+    """Part number for `solution_one` or `solve_part_one(...)` expressions"""
+    if isinstance(node, ast.Name):
+        return ANSWER_NAMES.get(node.id)
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        return SOLVER_PARTS.get(node.func.id)
+
+    return None
+
+
+def example_answers(module: ModuleType) -> Dict[int, Any]:
+    """Expected example answers, as asserted in the day's `main()`"""
+    answers = {}
+
+    for test, _ in _main_asserts(module):
+        part = _asserted_part(test.left)
+        if part is None:
+            continue
+
+        try:
+            answers[part] = ast.literal_eval(test.comparators[0])
+        except ValueError:  # Not a literal
+            continue
+
+    return answers
+
+
+def example_calls(module: ModuleType) -> List[ExampleCall]:
+    """Asserts of `main()` calling a module function on literal arguments
+
+    Such as day06 `find_idx_of_start_marker(msg, seq_len=4) == 7`, where
+    `msg` was assigned a literal earlier in `main()`.
+    """
+    calls = []
+
+    for test, local_literals in _main_asserts(module):
+        call = test.left
+        if not (
+            isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Name)
+            and call.func.id not in SOLVER_PARTS
+            and callable(getattr(module, call.func.id, None))
+        ):
+            continue
+
+        try:
+            calls.append(ExampleCall(
+                function=call.func.id,
+                args=tuple(_literal(arg, local_literals) for arg in call.args),
+                kwargs={
+                    keyword.arg: _literal(keyword.value, local_literals)
+                    for keyword in call.keywords
+                },
+                expected=_literal(test.comparators[0], local_literals),
+            ))
+        except (ValueError, TypeError):  # Starred or non-literal arguments
+            continue
+
+    return calls
+
+
+def check_example_answers(
+    days: Optional[Sequence[int]] = None,
+    parts: Sequence[int] = PARTS,
+) -> List[str]:
+    """Solve each day's examples and report answers that no longer match
+
+    Covers the asserted answers of `data/example.txt` and the asserted
+    calls on literal examples (see `example_calls`).
+    """
+    failures = []
+
+    for day in select_days(days):
+        module = day.load()
+
+        for call in example_calls(module):
+            answer = getattr(module, call.function)(*call.args, **call.kwargs)
+            if answer != call.expected:
+                failures.append(
+                    f"{day.name} {call}: expected {call.expected!r}, "
+                    f"got {answer!r}"
+                )
+
+        path = day.directory / "data" / "example.txt"
+        expected = example_answers(module)
+        checked_parts = [part for part in parts if part in expected]
+
+        if not path.exists() or not checked_parts:
+            continue
+
+        result = solve_file(day=day, path=path, parts=checked_parts)
+
+        for part in checked_parts:
+            if result.answers[part] != expected[part]:
+                failures.append(
+                    f"{day.name} part {part}: expected {expected[part]!r}, "
+                    f"got {result.answers[part]!r}"
+                )
+
+    return failures
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    tolerance: float = 0.25,
+    memory_tolerance: float = 0.10,
+    min_time: float = 1e-3,
+    min_memory: int = 64 * 1024,
+) -> List[Regression]:
+    """Entries whose median time or peak memory exceed the baseline
+
+    Each baseline stage may override the relative `tolerance` and
+    `memory_tolerance`; `min_time` and `min_memory` (bytes) are absolute
+    slacks against noise in very short or very small stages.
+    """
+    regressions = []
+
+    for day, files in current["results"].items():
+        for file_name, stages in files.items():
+            for stage, stats in stages.items():
+                base = (
+                    baseline["results"]
+                    .get(day, {})
+                    .get(file_name, {})
+                    .get(stage)
+                )
+                if base is None:
+                    continue
+
+                entry = f"{day}/{file_name}/{stage}"
+
+                time_limit = (
+                    base["median"] * (1 + base.get("tolerance", tolerance))
+                    + min_time
+                )
+                if stats["median"] > time_limit:
+                    regressions.append(Regression(
+                        entry=entry,
+                        metric="median",
+                        baseline=base["median"],
+                        current=stats["median"],
+                        limit=time_limit,
+                    ))
+
+                memory_limit = base["peak_memory"] * (
+                    1 + base.get("memory_tolerance", memory_tolerance)
+                ) + min_memory
+                if stats["peak_memory"] > memory_limit:
+                    regressions.append(Regression(
+                        entry=entry,
+                        metric="peak_memory",
+                        baseline=base["peak_memory"],
+                        current=stats["peak_memory"],
+                        limit=memory_limit,
+                    ))
+
+    return regressions
+
+
+def updated_baseline(
+    baseline: Optional[Dict[str, Any]],
+    current: Dict[str, Any],
+) -> Dict[str, Any]:
+    """The old baseline with the measured entries replaced by current ones
+
+    Entries that were not measured (other days, files or parts) are kept
+    as they are, and replaced entries keep their per-entry tolerances.
+    The top-level "meta" still describes the run that recorded the whole
+    baseline; each re-recorded day gets the current run's meta under
+    "day_meta" instead.
+    """
+    if baseline is None:
+        return current
+
+    updated = copy.deepcopy(baseline)
+
+    for day, files in current["results"].items():
+        updated.setdefault("day_meta", {})[day] = current["meta"]
+        for file_name, stages in files.items():
+            for stage, stats in stages.items():
+                entries = updated["results"].setdefault(day, {}).setdefault(
+                    file_name, {}
+                )
+                base = entries.get(stage, {})
+
+                stats = dict(stats)
+                for key in ("tolerance", "memory_tolerance"):
+                    if key in base:
+                        stats[key] = base[key]
+
+                entries[stage] = stats
+
+    return updated
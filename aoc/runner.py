@@ -0,0 +1,179 @@
+"""Run any subset of days, parts and data files in a single process"""
+import time
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from aoc import stats
+from aoc.cache import ParsedInputCache
+from aoc.days import (
+    PART_NAMES,
+    PARTS,
+    ROOT_DIR,
+    SOLVERS,
+    Day,
+    part_kwargs,
+    select_days,
+    select_files,
+)
+
+
+STREAM_SOLVER = "solve_stream"
+
+
+class RunResult(NamedTuple):
+    day: int
+    path: Path
+    answers: Dict[int, Any]
+    timings: Dict[str, float]  # Stage name -> wall time in seconds
+    counters: Dict[str, Dict[str, int]] = {}  # Stage name -> counters
+
+
+def stage_name(part: int) -> str:
+    return SOLVERS[part].replace("solve_", "")
+
+
+def solve_file(
+    day: Day,
+    path: Path,
+    parts: Sequence[int] = PARTS,
+    cache: Optional[ParsedInputCache] = None,
+    collect_stats: bool = False,
+    stream: Optional[IO] = None,
+    streaming: bool = False,
+) -> RunResult:
+    """Parse the file once and run the requested parts on it
+
+    Given a `stream` (e.g. stdin), the input is parsed from it instead and
+    `path` only serves as its label. With `streaming`, days providing a
+    `solve_stream` function solve both parts in one pass over the input.
+    """
+    module = day.load()
+
+    timings = {}
+    answers = {}
+    counters = {}
+
+    with stats.counting(module, enabled=collect_stats):
+        if streaming and hasattr(module, STREAM_SOLVER):
+            # Both parts at once, straight from the input
+            start = time.perf_counter()
+            solutions = getattr(module, STREAM_SOLVER)(
+                stream if stream is not None else str(path)
+            )
+            timings[STREAM_SOLVER] = time.perf_counter() - start
+            counters[STREAM_SOLVER] = stats.take(module)
+
+            answers = {part: solutions[part - 1] for part in parts}
+        else:
+            start = time.perf_counter()
+            if stream is not None:
+                data = module.read_data(stream)
+            elif cache is not None:
+                data = cache.read_data(module, path)
+            else:
+                data = module.read_data(str(path))
+            timings["read_data"] = time.perf_counter() - start
+            counters["read_data"] = stats.take(module)
+
+            for part in parts:
+                solver = getattr(module, SOLVERS[part])
+                kwargs = part_kwargs(module, path, part)
+
+                start = time.perf_counter()
+                answers[part] = solver(data, **kwargs)
+                timings[stage_name(part)] = time.perf_counter() - start
+                counters[stage_name(part)] = stats.take(module)
+
+    return RunResult(
+        day=day.number,
+        path=path,
+        answers=answers,
+        timings=timings,
+        counters={stage: c for stage, c in counters.items() if c},
+    )
+
+
+def run(
+    days: Optional[Sequence[int]] = None,
+    parts: Sequence[int] = PARTS,
+    files: Optional[Sequence[str]] = None,
+    cache: Optional[ParsedInputCache] = None,
+    collect_stats: bool = False,
+    streaming: bool = False,
+) -> Iterator[RunResult]:
+    for day in select_days(days):
+        for path in select_files(day, files):
+            yield solve_file(
+                day=day,
+                path=path,
+                parts=parts,
+                cache=cache,
+                collect_stats=collect_stats,
+                streaming=streaming,
+            )
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1_000_000:.2f} µs"
+
+    if seconds < 1:
+        return f"{seconds * 1_000:.2f} ms"
+
+    return f"{seconds:.2f} s"
+
+
+def display_path(path: Path) -> Path:
+    try:
+        return path.relative_to(ROOT_DIR)
+    except ValueError:
+        return path
+
+
+def format_result(result: RunResult) -> str:
+    first_stage = next(iter(result.timings))
+    lines = [
+        f"File: {display_path(result.path)} "
+        f"({first_stage}: {format_duration(result.timings[first_stage])})"
+    ]
+
+    for part, answer in sorted(result.answers.items()):
+        answer = str(answer)
+        if "\n" in answer:
+            answer = f"\n{answer}"
+
+        if stage_name(part) in result.timings:
+            duration = format_duration(result.timings[stage_name(part)])
+            lines.append(f"* {PART_NAMES[part]} ({duration}): {answer}")
+        else:
+            lines.append(f"* {PART_NAMES[part]}: {answer}")
+
+    for stage, counters in result.counters.items():
+        lines.append(f"  Stats ({stage}):")
+        for name, value in sorted(counters.items()):
+            lines.append(f"    {name:<24} {value:>16,}")
+
+    return "\n".join(lines) + "\n"
+
+
+def print_results(results: Iterator[RunResult]) -> List[RunResult]:
+    collected = []
+    start = time.perf_counter()
+
+    for result in results:
+        print(format_result(result))
+        collected.append(result)
+
+    total = time.perf_counter() - start
+    print(f"Total wall time: {format_duration(total)}")
+
+    return collected
@@ -0,0 +1,48 @@
+"""Hot-path counters exposed by day modules
+
+A day opts in by defining a module-level `STATS = HotPathStats()`, updated
+in its hot loops only when `STATS.enabled` is set, which keeps the overhead
+of disabled counters down to a single attribute lookup.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Dict, Iterator
+
+
+class HotPathStats(Counter):
+    """Counter switched on by the `aoc` runner (`--stats`)"""
+    __slots__ = ("enabled",)
+
+    def __init__(self):
+        super().__init__()
+        self.enabled = False
+
+
+def supports_stats(module: ModuleType) -> bool:
+    return isinstance(getattr(module, "STATS", None), HotPathStats)
+
+
+@contextmanager
+def counting(module: ModuleType, enabled: bool = True) -> Iterator[None]:
+    if not (enabled and supports_stats(module)):
+        yield
+        return
+
+    module.STATS.clear()
+    module.STATS.enabled = True
+    try:
+        yield
+    finally:
+        module.STATS.enabled = False
+
+
+def take(module: ModuleType) -> Dict[str, int]:
+    """Current counter values of the module, which are then reset"""
+    if not supports_stats(module):
+        return {}
+
+    values = dict(module.STATS)
+    module.STATS.clear()
+
+    return values
@@ -1,15 +1,69 @@
 """Day 1 - Advent of Code"""
-from typing import List
+import heapq
+import itertools
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
 
 InputType = List[List[int]]
 
 
-def read_data(path: str) -> InputType:
-    with open(path, "r") as fin:
-        return [
-            [int(cal) for cal in elf_calories.split("\n")]
-            for elf_calories in fin.read().split("\n\n")
-        ]
+def iter_elves(source: Source) -> Iterator[List[int]]:
+    elf_calories = []
+
+    for line in iter_lines(source):
+        line = line.strip()
+
+        if line:
+            elf_calories.append(int(line))
+        else:
+            yield elf_calories
+            elf_calories = []
+
+    if elf_calories:
+        yield elf_calories
+
+
+def iter_elf_totals(source: Source) -> Iterator[int]:
+    """Calorie total of each elf, without keeping the individual items"""
+    total = None
+
+    for line in iter_lines(source):
+        line = line.strip()
+
+        if line:
+            total = (total or 0) + int(line)
+        elif total is not None:
+            yield total
+            total = None
+
+    if total is not None:
+        yield total
+
+
+def read_data(source: Source) -> InputType:
+    return list(iter_elves(source))
+
+
+def top_k_totals(totals: Iterable[int], top_k: int = 3) -> List[int]:
+    """Largest `top_k` totals (descending), keeping only a size-k heap"""
+    heap: List[int] = []
+
+    for total in totals:
+        if len(heap) < top_k:
+            heapq.heappush(heap, total)
+        elif total > heap[0]:
+            heapq.heapreplace(heap, total)
+
+    return sorted(heap, reverse=True)
 
 
 def solve_part_one(data: InputType) -> int:
@@ -17,7 +71,97 @@ def solve_part_one(data: InputType) -> int:
 
 
 def solve_part_two(data: InputType, top_k: int = 3) -> int:
-    return sum(sorted(map(sum, data), reverse=True)[:top_k])
+    return sum(top_k_totals(map(sum, data), top_k=top_k))
+
+
+def solve_stream(source: Source, top_k: int = 3) -> Tuple[int, int]:
+    """Both parts in a single pass over the input, in O(top_k) memory"""
+    top_totals = top_k_totals(iter_elf_totals(source), top_k=top_k)
+
+    return top_totals[0], sum(top_totals)
+
+
+def chunk_ranges(buffer: mmap.mmap, chunks: int) -> List[Tuple[int, int]]:
+    """Split `buffer` into at most `chunks` byte ranges ending on blank lines"""
+    size = len(buffer)
+    ranges = []
+    start = 0
+
+    for i in range(1, chunks + 1):
+        if start >= size:
+            break
+
+        end = size
+        if i < chunks:
+            separator = buffer.find(b"\n\n", max(start, size * i // chunks - 1))
+            if separator != -1:
+                end = separator + 2
+
+        if end > start:
+            ranges.append((start, end))
+        start = end
+
+    return ranges
+
+
+def iter_buffer_totals(
+    buffer: mmap.mmap, start: int, end: int
+) -> Iterator[int]:
+    """Elf totals of the byte range [start, end), parsed straight as bytes"""
+    total = None
+    buffer.seek(start)
+
+    while buffer.tell() < end:
+        line = buffer.readline().strip()
+
+        if line:
+            total = (total or 0) + int(line)
+        elif total is not None:
+            yield total
+            total = None
+
+    if total is not None:
+        yield total
+
+
+def chunk_top_k(path: str, start: int, end: int, top_k: int) -> List[int]:
+    """Largest `top_k` elf totals of the byte range [start, end) of a file"""
+    with open(path, "rb") as fin:
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            totals = iter_buffer_totals(buffer, start, end)
+
+            return top_k_totals(totals, top_k=top_k)
+
+
+def solve_parallel(
+    path: Union[str, os.PathLike],
+    workers: Optional[int] = None,
+    top_k: int = 3,
+) -> Tuple[int, int]:
+    """Both parts over a memory-mapped file, one chunk per worker process"""
+    path = os.fspath(path)
+    workers = workers or os.cpu_count() or 1
+
+    with open(path, "rb") as fin:
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            ranges = chunk_ranges(buffer, workers)
+
+    if len(ranges) <= 1:
+        chunk_tops = [chunk_top_k(path, *bounds, top_k) for bounds in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            chunk_tops = list(
+                executor.map(
+                    chunk_top_k,
+                    itertools.repeat(path),
+                    *zip(*ranges),
+                    itertools.repeat(top_k),
+                )
+            )
+
+    top_totals = top_k_totals(itertools.chain(*chunk_tops), top_k=top_k)
+
+    return top_totals[0], sum(top_totals)
 
 
 def main():
@@ -27,6 +171,9 @@ def main():
         solution_one = solve_part_one(data)
         solution_two = solve_part_two(data)
 
+        assert solve_stream(path) == (solution_one, solution_two)
+        assert solve_parallel(path, workers=2) == (solution_one, solution_two)
+
         print(
             f"File: {path}\n"
             f"* Part One: {solution_one}\n"
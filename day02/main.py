@@ -1,18 +1,36 @@
 """Day 2 - Advent of Code"""
-from typing import List, Tuple
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, List, Mapping, Tuple, Union
+
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by `solve_numpy`
+    np = None
 
 InputType = List[Tuple[str, str]]
+ScoreTable = Tuple[Tuple[int, int, int], ...]
+MOVES = ("Rock", "Paper", "Scissors")
 SHAPE_SCORES = {"Rock": 1, "Paper": 2, "Scissors": 3}
+WINNING_MOVES = {"Rock": "Paper", "Paper": "Scissors", "Scissors": "Rock"}
+LOSING_MOVES = {v: k for k, v in WINNING_MOVES.items()}
+
 
+def iter_rounds(source: Source) -> Iterator[Tuple[str, str]]:
+    for line in iter_lines(source):
+        left, right = line.strip().split(" ")
+        yield left, right
 
-def read_data(path: str) -> InputType:
-    data = []
-    with open(path, "r") as fin:
-        for line in fin.readlines():
-            left, right = line.strip().split(" ")
-            data.append((left, right))
 
-    return data
+def read_data(source: Source) -> InputType:
+    return list(iter_rounds(source))
 
 
 def compute_outcome_score(opponent_move: str, my_move: str) -> int:
@@ -29,58 +47,87 @@ def compute_outcome_score(opponent_move: str, my_move: str) -> int:
     return 6
 
 
-def solve_part_one(data: InputType) -> int:
-    move_decoder = {
-        "A": "Rock", "B": "Paper", "C": "Scissors",
-        "X": "Rock", "Y": "Paper", "Z": "Scissors",
-    }
+def find_move(opponent_move: str, outcome: str) -> str:
+    if outcome == "X":  # Need to lose
+        return LOSING_MOVES[opponent_move]
+    elif outcome == "Y":  # Need to draw
+        return opponent_move
+    else:
+        assert outcome == "Z"  # Need to win
+        return WINNING_MOVES[opponent_move]
 
-    game_score = 0
-    for encoded_opponent_move, encoded_my_move in data:
-        opponent_move = move_decoder[encoded_opponent_move]
-        my_move = move_decoder[encoded_my_move]
 
-        round_score = compute_outcome_score(
-            opponent_move=opponent_move,
-            my_move=my_move,
-        ) + SHAPE_SCORES[my_move]
+def round_score(opponent_move: str, my_move: str) -> int:
+    return compute_outcome_score(
+        opponent_move=opponent_move,
+        my_move=my_move,
+    ) + SHAPE_SCORES[my_move]
 
-        game_score += round_score
 
-    return game_score
+# Score of a round indexed by [A/B/C][X/Y/Z], for both readings of X/Y/Z
+PART_ONE_SCORES: ScoreTable = tuple(
+    tuple(round_score(opponent_move, my_move) for my_move in MOVES)
+    for opponent_move in MOVES
+)
+PART_TWO_SCORES: ScoreTable = tuple(
+    tuple(
+        round_score(opponent_move, find_move(opponent_move, outcome))
+        for outcome in "XYZ"
+    )
+    for opponent_move in MOVES
+)
 
 
-def find_move(opponent_move: str, outcome: str) -> str:
-    winning_moves = {"Rock": "Paper", "Paper": "Scissors", "Scissors": "Rock"}
+def score_rounds(
+    round_counts: Mapping[Tuple[str, str], int], table: ScoreTable
+) -> int:
+    """Total score of rounds counted by their (opponent, response) letters"""
+    return sum(
+        table[ord(left) - ord("A")][ord(right) - ord("X")] * count
+        for (left, right), count in round_counts.items()
+    )
 
-    if outcome == "X":  # Need to lose
-        return {v: k for k, v in winning_moves.items()}[opponent_move]
-    elif outcome == "Y":  # Need to draw
-        return opponent_move
-    else:
-        assert outcome == "Z"  # Need to win
-        return winning_moves[opponent_move]
+
+def solve_part_one(data: InputType) -> int:
+    return score_rounds(Counter(data), PART_ONE_SCORES)
 
 
 def solve_part_two(data: InputType) -> int:
-    move_decoder = {"A": "Rock", "B": "Paper", "C": "Scissors"}
-
-    game_score = 0
-    for encoded_opponent_move, expected_outcome  in data:
-        opponent_move = move_decoder[encoded_opponent_move]
-        my_move = find_move(
-            opponent_move=opponent_move,
-            outcome=expected_outcome,
-        )
+    return score_rounds(Counter(data), PART_TWO_SCORES)
 
-        round_score = compute_outcome_score(
-            opponent_move=opponent_move,
-            my_move=my_move,
-        ) + SHAPE_SCORES[my_move]
 
-        game_score += round_score
+def solve_stream(source: Source) -> Tuple[int, int]:
+    """Both parts from a single pass counting the 9 kinds of rounds"""
+    round_counts = Counter(iter_rounds(source))
 
-    return game_score
+    return (
+        score_rounds(round_counts, PART_ONE_SCORES),
+        score_rounds(round_counts, PART_TWO_SCORES),
+    )
+
+
+def solve_numpy(path: Union[str, os.PathLike]) -> Tuple[int, int]:
+    """Both parts from the raw `A X\\n` bytes of a file, vectorized"""
+    if np is None:
+        raise RuntimeError("solve_numpy requires NumPy")
+
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+    if len(raw) % 4 not in (0, 3):  # The last round may lack its newline
+        raise ValueError(f"{path}: expected rounds of 4 bytes (A X\\n)")
+
+    # View of the first 3 bytes of every round, without copying the file
+    rounds = np.lib.stride_tricks.as_strided(
+        raw, shape=((len(raw) + 1) // 4, 3), strides=(4, 1), writeable=False
+    )
+    indices = (rounds[:, 0] - ord("A")) * 3 + (rounds[:, 2] - ord("X"))
+    round_counts = np.bincount(indices, minlength=9).astype(np.int64)
+    if len(round_counts) > 9:
+        raise ValueError(f"{path}: unexpected moves, expected A-C and X-Z")
+
+    return (
+        int(round_counts @ np.array(PART_ONE_SCORES).ravel()),
+        int(round_counts @ np.array(PART_TWO_SCORES).ravel()),
+    )
 
 
 def main():
@@ -90,6 +137,10 @@ def main():
         solution_one = solve_part_one(data)
         solution_two = solve_part_two(data)
 
+        assert solve_stream(path) == (solution_one, solution_two)
+        if np is not None:
+            assert solve_numpy(path) == (solution_one, solution_two)
+
         print(
             f"File: {path}\n"
             f"* Part One: {solution_one}\n"
@@ -1,5 +1,30 @@
 """Day 4 - Advent of Code"""
-from typing import List, NamedTuple, Tuple
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import accumulate, chain
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by `read_array` / `solve_numpy`
+    np = None
 
 
 class Range(NamedTuple):
@@ -26,16 +51,18 @@ class Range(NamedTuple):
 
 
 InputType = List[Tuple[Range, Range]]
+# `-` would be parsed as a sign, so both separators become plain whitespace
+SEPARATORS_TO_SPACES = bytes.maketrans(b"-,", b"  ")
 
 
-def read_data(path: str) -> InputType:
-    data = []
-    with open(path, "r") as fin:
-        for line in fin:
-            r1, r2 = line.split(",")
-            data.append((Range.from_string(r1), Range.from_string(r2)))
+def iter_pairs(source: Source) -> Iterator[Tuple[Range, Range]]:
+    for line in iter_lines(source):
+        r1, r2 = line.split(",")
+        yield Range.from_string(r1), Range.from_string(r2)
 
-    return data
+
+def read_data(source: Source) -> InputType:
+    return list(iter_pairs(source))
 
 
 def solve_part_one(data: InputType) -> int:
@@ -46,6 +73,147 @@ def solve_part_two(data: InputType) -> int:
     return sum(1 for r1, r2 in data if r1.overlaps(r2) or r2.overlaps(r1))
 
 
+class IntervalNode(NamedTuple):
+    """Ranges containing `center`, split around it into two subtrees"""
+    center: int
+    by_min: List[Range]  # Ascending `min`
+    by_max: List[Range]  # Descending `max`
+    left: Optional["IntervalNode"]  # Ranges entirely below `center`
+    right: Optional["IntervalNode"]  # Ranges entirely above `center`
+
+    @classmethod
+    def build(cls, ranges: List[Range]) -> Optional["IntervalNode"]:
+        if not ranges:
+            return None
+
+        # The median endpoint belongs to a range, so every node keeps one
+        endpoints = sorted(chain.from_iterable(ranges))
+        center = endpoints[len(endpoints) // 2]
+
+        here = [r for r in ranges if r.min <= center <= r.max]
+
+        return cls(
+            center=center,
+            by_min=sorted(here, key=lambda r: r.min),
+            by_max=sorted(here, key=lambda r: r.max, reverse=True),
+            left=cls.build([r for r in ranges if r.max < center]),
+            right=cls.build([r for r in ranges if r.min > center]),
+        )
+
+
+class RangeIndex:
+    """Queries over every section assignment of the file at once
+
+    A centered interval tree reports the ranges overlapping a query in
+    O(log n + k), sorted endpoints count them in O(log n) and a single
+    sweep precomputes how many sections are covered by at least k ranges.
+    """
+
+    def __init__(self, ranges: Iterable[Range]):
+        self.ranges = list(ranges)
+        self.root = IntervalNode.build(self.ranges)
+        self.mins = sorted(r.min for r in self.ranges)
+        self.maxs = sorted(r.max for r in self.ranges)
+        self.covered = self._coverage_by_depth()
+
+    @classmethod
+    def from_pairs(cls, data: InputType) -> "RangeIndex":
+        return cls(chain.from_iterable(data))
+
+    def _coverage_by_depth(self) -> List[int]:
+        """Number of sections covered by at least k ranges, indexed by k"""
+        events: Dict[int, int] = Counter()
+        for r in self.ranges:
+            events[r.min] += 1
+            events[r.max + 1] -= 1
+
+        sections_at_depth: Dict[int, int] = Counter()
+        depth = 0
+        positions = sorted(events)
+        for position, next_position in zip(positions, positions[1:]):
+            depth += events[position]
+            sections_at_depth[depth] += next_position - position
+
+        max_depth = max(sections_at_depth, default=0)
+        at_least = accumulate(
+            (sections_at_depth[k] for k in range(max_depth, 0, -1))
+        )
+
+        return [0] + list(at_least)[::-1]
+
+    def overlapping(self, query: Range) -> List[Range]:
+        """Ranges sharing at least one section with `query`"""
+        found = []
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            if query.max < node.center:
+                for r in node.by_min:
+                    if r.min > query.max:
+                        break
+                    found.append(r)
+                stack.append(node.left)
+            elif query.min > node.center:
+                for r in node.by_max:
+                    if r.max < query.min:
+                        break
+                    found.append(r)
+                stack.append(node.right)
+            else:
+                found.extend(node.by_min)
+                stack.extend((node.left, node.right))
+
+        return found
+
+    def stabbing(self, section: int) -> List[Range]:
+        """Ranges containing `section`"""
+        return self.overlapping(Range(min=section, max=section))
+
+    def count_overlapping(self, query: Range) -> int:
+        ending_before = bisect_left(self.maxs, query.min)
+        starting_after = len(self.mins) - bisect_right(self.mins, query.max)
+
+        return len(self.ranges) - ending_before - starting_after
+
+    def coverage(self, k: int = 1) -> int:
+        """Number of sections covered by at least `k` ranges"""
+        if max(k, 1) >= len(self.covered):
+            return 0
+
+        return self.covered[max(k, 1)]
+
+
+def read_array(path: Union[str, os.PathLike]) -> "np.ndarray":
+    """All pairs as an (N, 4) array of (min1, max1, min2, max2) rows"""
+    if np is None:
+        raise RuntimeError("read_array requires NumPy")
+
+    with open(path, "rb") as fin:
+        raw = fin.read().translate(SEPARATORS_TO_SPACES)
+
+    values = np.fromstring(raw, dtype=np.int64, sep=" ")
+    if len(values) % 4:
+        raise ValueError(f"{path}: expected lines of the form a-b,c-d")
+
+    return values.reshape(-1, 4)
+
+
+def solve_numpy(path: Union[str, os.PathLike]) -> Tuple[int, int]:
+    """Both parts with vectorized comparisons over `read_array`"""
+    min1, max1, min2, max2 = read_array(path).T
+
+    contained = ((min1 <= min2) & (max2 <= max1)) | (
+        (min2 <= min1) & (max1 <= max2)
+    )
+    overlapping = (min1 <= max2) & (min2 <= max1)
+
+    return int(np.count_nonzero(contained)), int(np.count_nonzero(overlapping))
+
+
 def main():
     for path in ("data/example.txt", "data/input.txt"):
         data = read_data(path)
@@ -57,6 +225,30 @@ def main():
             assert solution_one == 2
             assert solution_two == 4
 
+        if np is not None:
+            assert solve_numpy(path) == (solution_one, solution_two)
+
+        # Cross-check RangeIndex against brute force on a sample of queries
+        index = RangeIndex.from_pairs(data)
+        depth = Counter(
+            section for r in index.ranges
+            for section in range(r.min, r.max + 1)
+        )
+        for query in index.ranges[::25] + [Range(min=0, max=0)]:
+            expected = sorted(
+                r for r in index.ranges
+                if r.min <= query.max and query.min <= r.max
+            )
+            assert sorted(index.overlapping(query)) == expected
+            assert index.count_overlapping(query) == len(expected)
+            assert sorted(index.stabbing(query.max)) == sorted(
+                r for r in index.ranges if r.min <= query.max <= r.max
+            )
+        for k in range(max(depth.values(), default=0) + 2):
+            assert index.coverage(k) == sum(
+                1 for count in depth.values() if count >= max(k, 1)
+            )
+
         print(
             f"File: {path}\n"
             f"* Part One: {solution_one}\n"
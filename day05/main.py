@@ -1,8 +1,15 @@
 """Day 5 - Advent of Code"""
-from copy import deepcopy
-from typing import List, NamedTuple, Tuple
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
 
-StackType = List[str]
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+
+Stack = List[str]  # Bottom crate first, so the top crate is `stack[-1]`
+StackType = List[Stack]
 
 
 class Move(NamedTuple):
@@ -26,56 +33,98 @@ class Move(NamedTuple):
 InputType = Tuple[StackType, List[Move]]
 
 
-def read_data(path: str) -> InputType:
-    with open(path, "r") as fin:
-        _, moves_raw = fin.read().split("\n\n")
+def parse_stacks(lines: Iterator[str]) -> StackType:
+    """Stacks of the drawing at the start of `lines`
 
-        # Parsing those stacks would be a waste of time - let's hardcode them
-        if path == "data/example.txt":
-            stacks = ["NZ", "DCM", "P"]
-        elif path == "data/input.txt":
-            stacks = [
-                "VJBD",
-                "FDRWBVP",
-                "QWCDLFGR",
-                "BDNLMPJW",
-                "QSCPBNH",
-                "GNSBDR",
-                "HSFQMPBZ",
-                "FLW",
-                "RMFVS",
-            ]
-        else:
-            raise RuntimeError("Should not happen!")
-
-        moves = [Move.from_string(line) for line in moves_raw.split("\n")]
-
-        return stacks, moves
+    Crate letters sit every 4 columns, so each drawing line contributes
+    `line[1::4]` to the stacks. The drawing ends with the stack-number line,
+    which must be followed by a blank line; both are consumed.
+    """
+    columns: List[List[str]] = []
+    num_stacks = None
 
+    for line in lines:
+        line = line.rstrip("\n")
 
-def solve_part_one(data: InputType) -> str:
-    stacks, moves = deepcopy(data)
+        if "[" not in line:  # Stack numbers
+            labels = line.split()
+            if not labels or not all(label.isdigit() for label in labels):
+                raise ValueError(f"Expected stack numbers, got {line[:40]!r}")
 
-    for move in moves:
-        for _ in range(move.N):
-            c = stacks[move.src - 1][0]
-            stacks[move.src - 1] = stacks[move.src - 1][1:]
-            stacks[move.dst - 1] = c + stacks[move.dst - 1]
+            num_stacks = len(labels)
+            break
 
-    answer = "".join([stack[0] for stack in stacks])
-    return answer
+        crates = line[1::4]
+        if len(crates) > len(columns):
+            columns.extend([] for _ in range(len(crates) - len(columns)))
 
+        for column, crate in zip(columns, crates):
+            if crate != " ":
+                column.append(crate)
 
-def solve_part_two(data: InputType) -> str:
-    stacks, moves = deepcopy(data)
+    if num_stacks is None:
+        raise ValueError("Missing the stack-number line of the drawing")
+    if len(columns) > num_stacks:
+        raise ValueError(f"Crates found beyond the {num_stacks} stacks")
+    separator = next(lines, None)
+    if separator is None or separator.strip():
+        raise ValueError("Expected a blank line after the stack numbers")
+
+    columns.extend([] for _ in range(num_stacks - len(columns)))
+
+    # Drawing lines go from the top down
+    return [column[::-1] for column in columns]
+
+
+def read_data(source: Source) -> InputType:
+    lines = iter_lines(source)
+
+    stacks = parse_stacks(lines)
+    moves = [Move.from_string(line.strip()) for line in lines if line.strip()]
 
     for move in moves:
-        c = stacks[move.src - 1][:move.N]
-        stacks[move.src - 1] = stacks[move.src - 1][move.N:]
-        stacks[move.dst - 1] = c + stacks[move.dst - 1]
+        if not (1 <= move.src <= len(stacks) and 1 <= move.dst <= len(stacks)):
+            raise ValueError(f"{move} refers to a missing stack")
+
+    return stacks, moves
+
+
+def rearrange(
+    stacks: StackType, moves: Iterable[Move], keep_order: bool
+) -> StackType:
+    """Apply `moves` with single slice operations on the ends of the stacks
+
+    The CrateMover 9000 moves crates one at a time, which reverses the
+    moved slice; the CrateMover 9001 (`keep_order`) moves it as a whole.
+    """
+    stacks = [list(stack) for stack in stacks]
+
+    for N, src, dst in moves:
+        source = stacks[src - 1]
+        crates = source[len(source) - N:]  # Not `[-N:]`, which breaks on N=0
+        del source[len(source) - N:]
+
+        if not keep_order:
+            crates.reverse()
+        stacks[dst - 1].extend(crates)
+
+    return stacks
+
+
+def top_crates(stacks: StackType) -> str:
+    return "".join([stack[-1] for stack in stacks if stack])
+
+
+def solve_part_one(data: InputType) -> str:
+    stacks, moves = data
+
+    return top_crates(rearrange(stacks, moves, keep_order=False))
+
+
+def solve_part_two(data: InputType) -> str:
+    stacks, moves = data
 
-    answer = "".join([stack[0] for stack in stacks])
-    return answer
+    return top_crates(rearrange(stacks, moves, keep_order=True))
 
 
 def main():
@@ -1,16 +1,124 @@
 """Day 6 - Advent of Code"""
+import os
+import sys
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+
 InputType = str
+CHUNK_SIZE = 1 << 20
+
+
+def read_data(source: Source) -> InputType:
+    return "".join(iter_lines(source))
+
+
+def iter_chunks(
+    source: Source, chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Raw bytes of a file path or stream, or the pieces of an iterable
+
+    Streams are read in `chunk_size` pieces rather than line by line, since
+    the whole signal is a single line.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fin:
+            yield from iter(partial(fin.read, chunk_size), b"")
+    elif hasattr(source, "read"):
+        for piece in iter(partial(source.read, chunk_size), source.read(0)):
+            yield piece.encode() if isinstance(piece, str) else piece
+    else:
+        for piece in source:
+            yield piece.encode() if isinstance(piece, str) else piece
+
+
+class MarkerDetector:
+    """Incremental marker detection over a signal fed in byte chunks
+
+    Only the last position of every byte value and the start of the current
+    run of distinct bytes are kept, so each byte is O(1) whatever the
+    lengths, and that state carries over chunk boundaries: the signal never
+    has to be buffered.
+    """
+
+    def __init__(self, seq_lens: Sequence[int] = (4, 14)):
+        self.pending = sorted(set(seq_lens))
+        self.markers: Dict[int, int] = {}
+        self.last_seen = [-1] * 256
+        self.run_start = 0
+        self.position = 0
+
+    @property
+    def done(self) -> bool:
+        return not self.pending
+
+    def feed(self, chunk: bytes) -> List[Tuple[int, int]]:
+        """(seq_len, end offset) of the markers completed within `chunk`
+
+        Chunks may be any buffers yielding ints (bytes, `memoryview(mmap)`).
+        """
+        found = []
+        pending, last_seen = self.pending, self.last_seen
+        run_start, position = self.run_start, self.position
+
+        for byte in chunk:
+            if not pending:
+                break
 
+            if last_seen[byte] >= run_start:
+                run_start = last_seen[byte] + 1
+            last_seen[byte] = position
+            position += 1
 
-def read_data(path: str) -> InputType:
-    with open(path, "r") as fin:
-        return fin.read()
+            # The run grows one byte at a time, so shorter lengths hit first
+            while pending and position - run_start >= pending[0]:
+                found.append((pending.pop(0), position))
+
+        self.run_start, self.position = run_start, position
+        self.markers.update(found)
+
+        return found
+
+
+def find_markers(
+    chunks: Iterable[bytes], seq_lens: Sequence[int] = (4, 14)
+) -> Dict[int, int]:
+    """End offset of the first run of `seq_len` distinct bytes, per length
+
+    Reading stops once every marker has been found.
+    """
+    detector = MarkerDetector(seq_lens)
+
+    for chunk in chunks:
+        if detector.done:
+            break
+        detector.feed(chunk)
+
+    return detector.markers
 
 
 def find_idx_of_start_marker(data: InputType, seq_len: int = 4) -> int:
-    for i in range(seq_len, len(data)):
-        if len(set(data[i - seq_len:i])) == seq_len:
-            return i
+    return find_markers([data.encode()], seq_lens=(seq_len,)).get(seq_len)
+
+
+def solve_part_one(data: InputType) -> int:
+    return find_idx_of_start_marker(data, seq_len=4)
+
+
+def solve_part_two(data: InputType) -> int:
+    return find_idx_of_start_marker(data, seq_len=14)
+
+
+def solve_stream(source: Source) -> Tuple[int, int]:
+    """Both markers in a single pass over the raw bytes of the signal"""
+    markers = find_markers(iter_chunks(source), seq_lens=(4, 14))
+
+    return markers.get(4), markers.get(14)
 
 
 def main():
@@ -18,6 +126,12 @@ def main():
     assert find_idx_of_start_marker(msg, seq_len=4) == 7
     assert find_idx_of_start_marker(msg, seq_len=14) == 19
 
+    detector = MarkerDetector(seq_lens=(4, 14))
+    assert detector.feed(msg[:5].encode()) == []
+    assert detector.feed(msg[5:18].encode()) == [(4, 7)]
+    assert detector.feed(msg[18:].encode()) == [(14, 19)]
+    assert detector.done
+
     msg = "bvwbjplbgvbhsrlpgdmjqwftvncz"
     assert find_idx_of_start_marker(msg, seq_len=4) == 5
     assert find_idx_of_start_marker(msg, seq_len=14) == 23
@@ -37,8 +151,10 @@ def main():
     for path in ("data/input.txt",):
         data = read_data(path)
 
-        solution_one = find_idx_of_start_marker(data, seq_len=4)
-        solution_two = find_idx_of_start_marker(data, seq_len=14)
+        solution_one = solve_part_one(data)
+        solution_two = solve_part_two(data)
+
+        assert solve_stream(path) == (solution_one, solution_two)
 
         print(
             f"File: {path}\n"
@@ -1,130 +1,139 @@
 """Day 7 - Advent of Code"""
-from typing import Dict, List, NamedTuple, Optional
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+
+ROOT = 0
+
+
+class FileTree(NamedTuple):
+    """Directories as parallel arrays, indexed by directory id
+
+    Directories are numbered in discovery order, so a parent always has a
+    smaller id than its subdirectories; the root is `ROOT` (no parent: -1).
+    """
+    parents: array  # Parent directory id
+    sizes: array  # Total size of the files in the directory and below
+    name_ids: array  # Index of the directory name in `names`
+    names: List[str]  # Distinct directory names
+
+    def full_path(self, directory: int) -> str:
+        parts = []
+
+        while directory != ROOT:
+            parts.append(self.names[self.name_ids[directory]])
+            directory = self.parents[directory]
+
+        return "/" + "/".join(reversed(parts))
+
+
+InputType = FileTree
+
+
+def read_data(source: Source) -> InputType:
+    parents = array("q", [-1])
+    sizes = array("q", [0])
+    name_ids = array("q", [0])
+    names = ["/"]
+
+    # Only needed while parsing: name -> id, (parent, name id) -> directory
+    name_index: Dict[str, int] = {"/": 0}
+    children: Dict[Tuple[int, int], int] = {}
+
+    current_dir = ROOT
+    for line in iter_lines(source):
+        line = line.rstrip("\n")
+
+        if line.startswith("$ cd "):
+            target_dir = line[5:]
+
+            if target_dir == "/":
+                current_dir = ROOT
+            elif target_dir == "..":
+                current_dir = parents[current_dir]
+            else:
+                name_id = name_index[target_dir]
+                current_dir = children[current_dir, name_id]
+        elif line.startswith("dir "):
+            dir_name = line[4:]
+            name_id = name_index.setdefault(dir_name, len(names))
+            if name_id == len(names):
+                names.append(dir_name)
+
+            assert (current_dir, name_id) not in children
+
+            children[current_dir, name_id] = len(parents)
+            parents.append(current_dir)
+            sizes.append(0)
+            name_ids.append(name_id)
+        elif line and not line.startswith("$"):
+            size, _ = line.split(" ", 1)
+            sizes[current_dir] += int(size)
+
+    # Subdirectories have larger ids, so this pushes every size up in order
+    for directory in range(len(parents) - 1, ROOT, -1):
+        sizes[parents[directory]] += sizes[directory]
+
+    return FileTree(
+        parents=parents,
+        sizes=sizes,
+        name_ids=name_ids,
+        names=names,
+    )
 
 
-class File(NamedTuple):
-    name: str
-    size: int
+class SizeIndex(NamedTuple):
+    """Sorted directory sizes with prefix sums, for repeated size queries"""
+    sizes: List[int]  # Ascending
+    prefix_sums: List[int]  # prefix_sums[i] = sum(sizes[:i])
 
     @classmethod
-    def from_string(cls, raw: str) -> "File":
-        size, name = raw.split(" ")
-
-        return cls(name=name, size=int(size))
-
-
-class Directory(NamedTuple):
-    full_path: str
-    parent_dir: Optional["Directory"]
-    directories: Dict[str, "Directory"]
-    files: List[File]
-
-    def size(self) -> int:
-        file_sizes = sum(file.size for file in self.files)
-        subdir_sizes = sum(
-            sub_directory.size()
-            for sub_directory in self.directories.values()
-        )
-
-        return file_sizes + subdir_sizes
-
-    def __repr__(self):
-        parent_dir_path = (
-            self.parent_dir.full_path
-            if self.parent_dir is not None
-            else None
-        )
-        return (
-            f"Directory("
-            f"full_path={self.full_path}, "
-            f"parent={parent_dir_path}, "
-            f"directories={self.directories}, "
-            f"files={self.files})"
-        )
-
-    def __hash__(self) -> int:
-        return hash(self.full_path)
+    def from_tree(cls, tree: FileTree) -> "SizeIndex":
+        sizes = sorted(tree.sizes)
 
+        return cls(sizes=sizes, prefix_sums=list(accumulate(sizes, initial=0)))
 
-InputType = Directory
+    def sum_at_most(self, threshold: int) -> int:
+        """Sum of the directory sizes <= `threshold`, in O(log n)"""
+        return self.prefix_sums[bisect_right(self.sizes, threshold)]
 
+    def smallest_at_least(self, threshold: int) -> Optional[int]:
+        """Smallest directory size >= `threshold`, in O(log n)"""
+        idx = bisect_left(self.sizes, threshold)
 
-def read_data(path: str) -> InputType:
-    with open(path, "r") as fin:
-        file_tree = Directory("/", None, {}, [])
-        current_dir = file_tree
+        return self.sizes[idx] if idx < len(self.sizes) else None
 
-        for line in fin.read().split("$")[1:]:
-            command, *output = line.lstrip().split("\n")
+    def top_k(self, k: int) -> List[int]:
+        """The `k` largest directory sizes, descending, in O(k)"""
+        return self.sizes[max(len(self.sizes) - k, 0):][::-1] if k > 0 else []
 
-            if command.startswith("cd"):
-                target_dir = command.replace("cd ", "")
+    def top_k_sum(self, k: int) -> int:
+        """Sum of the `k` largest directory sizes, in O(1)"""
+        k = max(0, min(k, len(self.sizes)))
 
-                if target_dir == "/":
-                    current_dir = file_tree
-                elif target_dir == "..":
-                    current_dir = current_dir.parent_dir
-                else:
-                    assert target_dir in current_dir.directories.keys()
-                    current_dir = current_dir.directories[target_dir]
-            elif command.startswith("ls"):
-                for entry in output:
-                    if entry == "":
-                        continue
-                    elif entry.startswith("dir"):
-                        dir_name = entry.replace("dir ", "")
-
-                        assert dir_name not in current_dir.directories.keys()
-
-                        current_path = current_dir.full_path
-                        if current_path == "/":
-                            full_path = f"/{dir_name}"
-                        else:
-                            full_path = f"{current_path}/{dir_name}"
-
-                        current_dir.directories[dir_name] = Directory(
-                            full_path=full_path,
-                            parent_dir=current_dir,
-                            directories={},
-                            files=[],
-                        )
-                    else:
-                        current_dir.files.append(File.from_string(entry))
-        return file_tree
-
-
-def get_directory_sizes(file_tree: Directory) -> Dict[str, int]:
-    sizes = {}
-
-    def _collect(directory: Directory):
-        sizes[directory.full_path] = directory.size()
-        for name, sub_directory in directory.directories.items():
-            _collect(sub_directory)
-
-    _collect(file_tree)
-    return sizes
+        return self.prefix_sums[-1] - self.prefix_sums[len(self.sizes) - k]
 
 
 def solve_part_one(data: InputType) -> int:
-    directory_sizes = get_directory_sizes(data)
-
-    return sum(size for size in directory_sizes.values() if size <= 100_000)
+    return SizeIndex.from_tree(data).sum_at_most(100_000)
 
 
 def solve_part_two(data: InputType) -> int:
-    directory_sizes = get_directory_sizes(data)
-
     total_disk_space = 70_000_000
     required_space = 30_000_000
-    current_free_space = total_disk_space - directory_sizes["/"]
+    current_free_space = total_disk_space - data.sizes[ROOT]
 
     space_to_free = required_space - current_free_space
 
-    return min(
-        size
-        for size in directory_sizes.values()
-        if size >= space_to_free
-    )
+    return SizeIndex.from_tree(data).smallest_at_least(space_to_free)
 
 
 def main():
@@ -1,109 +1,192 @@
 """Day 8 - Advent of Code"""
-from typing import Tuple
-
-InputType = Tuple[Tuple[int]]
-
-
-def read_data(path: str) -> InputType:
-    with open(path, "r") as fin:
-        return tuple(
-            tuple(int(height) for height in line)
-            for line in fin.read().split("\n")
-        )
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple, Union
 
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def is_visible(pos_i: int, pos_j: int, data: InputType) -> bool:
-    width, height = len(data[0]), len(data)
+from aoc.inputs import Source, iter_lines  # noqa: E402
 
-    tree_height = data[pos_i][pos_j]
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by `read_array` / `count_visible`
+    np = None
 
-    # Top
-    if all(data[i][pos_j] < tree_height for i in range(pos_i)):
-        return True
+InputType = Tuple[Tuple[int]]
+BLOCK_ROWS = 1024
 
-    # Bottom
-    if all(data[i][pos_j] < tree_height for i in range(pos_i + 1, height)):
-        return True
 
-    # Left
-    if all(data[pos_i][j] < tree_height for j in range(pos_j)):
-        return True
+def read_data(source: Source) -> InputType:
+    return tuple(
+        tuple(int(height) for height in line.rstrip("\n"))
+        for line in iter_lines(source)
+    )
 
-    # Right
-    if all(data[pos_i][j] < tree_height for j in range(pos_j + 1, width)):
-        return True
 
-    return False
+def visible_from_start(heights: Sequence[int]) -> List[bool]:
+    """Trees taller than every tree before them (running maximum)"""
+    visible = []
+    tallest = -1
 
+    for height in heights:
+        visible.append(height > tallest)
+        tallest = max(tallest, height)
 
-def solve_part_one(data: InputType) -> int:
-    width, height = len(data[0]), len(data)
+    return visible
 
-    num_visible = 0
 
-    # Add border
-    num_visible += 2 * width + 2 * (height - 2)
+def viewing_distances(heights: Sequence[int]) -> List[int]:
+    """Trees seen looking back towards the start, until one at least as tall
 
-    # Check interior
-    for i in range(1, height - 1):
-        for j in range(1, width - 1):
-            if is_visible(i, j, data):
-                num_visible += 1
+    The stack keeps the indices of the trees not yet blocked by a taller
+    one, in decreasing height order, so each tree is pushed and popped once.
+    """
+    distances = []
+    stack: List[int] = []
 
-    return num_visible
+    for idx, height in enumerate(heights):
+        while stack and heights[stack[-1]] < height:
+            stack.pop()
 
+        distances.append(idx - stack[-1] if stack else idx)
+        stack.append(idx)
 
-def compute_scenic_score(pos_i: int, pos_j: int, data: InputType) -> int:
-    width, height = len(data[0]), len(data)
+    return distances
 
-    tree_height = data[pos_i][pos_j]
 
-    # Top
-    dist_top = 0
-    for i in reversed(range(pos_i)):
-        dist_top += 1
+def sweep_visibility(lines: Iterable[Sequence[int]]) -> List[List[bool]]:
+    """Visibility of each tree from either end of its line"""
+    return [
+        [
+            forward or backward
+            for forward, backward in zip(
+                visible_from_start(line),
+                reversed(visible_from_start(line[::-1])),
+            )
+        ]
+        for line in lines
+    ]
 
-        if data[i][pos_j] >= tree_height:
-            break
 
-    # Bottom
-    dist_bottom = 0
-    for i in range(pos_i + 1, height):
-        dist_bottom += 1
+def sweep_scores(lines: Iterable[Sequence[int]]) -> List[List[int]]:
+    """Product of the viewing distances towards both ends of each line"""
+    return [
+        [
+            forward * backward
+            for forward, backward in zip(
+                viewing_distances(line),
+                reversed(viewing_distances(line[::-1])),
+            )
+        ]
+        for line in lines
+    ]
 
-        if data[i][pos_j] >= tree_height:
-            break
 
-    # Left
-    dist_left = 0
-    for j in reversed(range(pos_j)):
-        dist_left += 1
-
-        if data[pos_i][j] >= tree_height:
-            break
+def solve_part_one(data: InputType) -> int:
+    # Left/right sweeps over the rows, top/bottom sweeps over the columns
+    visible_in_rows = sweep_visibility(data)
+    visible_in_columns = zip(*sweep_visibility(tuple(zip(*data))))
 
-    # Right
-    dist_right = 0
-    for j in range(pos_j + 1, width):
-        dist_right += 1
+    return sum(
+        in_row or in_column
+        for row, column in zip(visible_in_rows, visible_in_columns)
+        for in_row, in_column in zip(row, column)
+    )
 
-        if data[pos_i][j] >= tree_height:
-            break
 
-    return dist_top * dist_bottom * dist_left * dist_right
+def solve_part_two(data: InputType) -> int:
+    row_scores = sweep_scores(data)
+    column_scores = zip(*sweep_scores(tuple(zip(*data))))
+
+    return max(
+        row_score * column_score
+        for row, column in zip(row_scores, column_scores)
+        for row_score, column_score in zip(row, column)
+    )
+
+
+def read_array(path: Union[str, os.PathLike]) -> "np.ndarray":
+    """The forest as a (height, width) uint8 view of the file's ASCII digits
+
+    Nothing is copied: the array is a strided view over the memory-mapped
+    file, skipping the newlines. ASCII digits sort like the heights, so
+    `count_visible` can use the view as is.
+    """
+    if np is None:
+        raise RuntimeError("read_array requires NumPy")
+
+    with open(path, "rb") as fin:
+        buffer = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+
+    width = buffer.find(b"\n")
+    if width == -1:
+        width = len(raw)
+    height = (len(raw) + 1) // (width + 1)
+    if len(raw) not in (height * (width + 1) - 1, height * (width + 1)):
+        raise ValueError(f"{path}: expected lines of {width} digits")
+
+    return np.lib.stride_tricks.as_strided(
+        raw, shape=(height, width), strides=(width + 1, 1), writeable=False
+    )
+
+
+def exclusive_maximum(block: "np.ndarray", axis: int, initial) -> "np.ndarray":
+    """Tallest tree before each tree along `axis`, `initial` before the first"""
+    tallest = np.maximum.accumulate(block, axis=axis)
+    tallest = np.roll(tallest, 1, axis=axis)
+
+    first = [slice(None)] * block.ndim
+    first[axis] = 0
+    tallest[tuple(first)] = initial
+
+    return np.maximum(tallest, initial)
+
+
+def count_visible(grid: "np.ndarray", block_rows: int = BLOCK_ROWS) -> int:
+    """Part one over a uint8 grid, `block_rows` rows at a time
+
+    The grid may hold heights or their ASCII digits: blocks are widened to
+    int16 so that -1 lies below any tree. Rows are independent for the
+    left/right sweeps; the top/bottom sweeps carry the column maxima across
+    blocks, so memory stays proportional to `block_rows * width` whatever
+    the height of the forest.
+    """
+    height, width = grid.shape
+    starts = range(0, height, block_rows)
+
+    # Tallest tree of each column below every block, from a first reverse pass
+    block_maxima = np.full((len(starts) + 1, width), -1, dtype=np.int16)
+    for idx, start in reversed(list(enumerate(starts))):
+        np.maximum(
+            block_maxima[idx + 1],
+            grid[start:start + block_rows].max(axis=0),
+            out=block_maxima[idx],
+        )
 
+    num_visible = 0
+    above = np.full(width, -1, dtype=np.int16)
 
-def solve_part_two(data: InputType) -> int:
-    width, height = len(data[0]), len(data)
+    for idx, start in enumerate(starts):
+        block = grid[start:start + block_rows].astype(np.int16)
+        below = block_maxima[idx + 1]
 
-    max_scenic_score = 0
+        visible = block > exclusive_maximum(block, axis=1, initial=-1)
+        visible |= block > exclusive_maximum(
+            block[:, ::-1], axis=1, initial=-1
+        )[:, ::-1]
+        visible |= block > exclusive_maximum(block, axis=0, initial=above)
+        visible |= block > exclusive_maximum(
+            block[::-1], axis=0, initial=below
+        )[::-1]
 
-    for i in range(1, height - 1):
-        for j in range(1, width - 1):
-            scenic_ij = compute_scenic_score(i, j, data)
-            max_scenic_score = max(max_scenic_score, scenic_ij)
+        num_visible += int(np.count_nonzero(visible))
+        above = np.maximum(above, block.max(axis=0))
 
-    return max_scenic_score
+    return num_visible
 
 
 def main():
@@ -117,6 +200,9 @@ def main():
             assert solution_one == 21
             assert solution_two == 8
 
+        if np is not None:
+            assert count_visible(read_array(path)) == solution_one
+
         print(
             f"File: {path}\n"
             f"* Part One: {solution_one}\n"
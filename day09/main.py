@@ -1,5 +1,12 @@
 """Day 9 - Advent of Code"""
-from typing import Dict, List, NamedTuple, Tuple
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
 
 DirectionVector = Tuple[int, int]
 InputType = List[Tuple[DirectionVector, int]]
@@ -10,7 +17,7 @@ class Position(NamedTuple):
     y: int
 
 
-def read_data(path: str) -> InputType:
+def iter_instructions(source: Source) -> Iterator[Tuple[DirectionVector, int]]:
     direction_vectors = {
         "U": (0, -1),
         "D": (0, 1),
@@ -18,12 +25,13 @@ def read_data(path: str) -> InputType:
         "R": (1, 0),
     }
 
-    instructions = []
-    with open(path, "r") as fin:
-        for line in fin.readlines():
-            direction, steps = line.strip().split(" ")
-            instructions.append((direction_vectors[direction], int(steps)))
-    return instructions
+    for line in iter_lines(source):
+        direction, steps = line.strip().split(" ")
+        yield direction_vectors[direction], int(steps)
+
+
+def read_data(source: Source) -> InputType:
+    return list(iter_instructions(source))
 
 
 def is_adjacent(x1: int, y1: int, x2: int, y2: int) -> bool:
@@ -92,12 +100,20 @@ def number_of_distinct_tail_positions(data: InputType, rope_length: int) -> int:
     return len(set(positions[rope_length - 1]))
 
 
+def solve_part_one(data: InputType) -> int:
+    return number_of_distinct_tail_positions(data, rope_length=2)
+
+
+def solve_part_two(data: InputType) -> int:
+    return number_of_distinct_tail_positions(data, rope_length=10)
+
+
 def main():
     for path in ("data/example.txt", "data/input.txt"):
         data = read_data(path)
 
-        solution_one = number_of_distinct_tail_positions(data, rope_length=2)
-        solution_two = number_of_distinct_tail_positions(data, rope_length=10)
+        solution_one = solve_part_one(data)
+        solution_two = solve_part_two(data)
 
         if path == "data/example.txt":
             assert solution_one == 13
@@ -1,18 +1,26 @@
 """Day 10 - Advent of Code"""
-from typing import List, Tuple, Optional
+import sys
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
 
 InputType = List[Tuple[str, Optional[int]]]
 
 
-def read_data(path: str) -> InputType:
-    instructions = []
-    with open(path, "r") as fin:
-        for line in fin.read().split("\n"):
-            if line.startswith("addx"):
-                instructions.append(("addx", int(line.split(" ")[1])))
-            else:
-                instructions.append(("noop", None))
-    return instructions
+def iter_instructions(source: Source) -> Iterator[Tuple[str, Optional[int]]]:
+    for line in iter_lines(source):
+        if line.startswith("addx"):
+            yield "addx", int(line.split(" ")[1])
+        else:
+            yield "noop", None
+
+
+def read_data(source: Source) -> InputType:
+    return list(iter_instructions(source))
 
 
 def run_program(instructions: InputType) -> List[int]:
@@ -1,7 +1,17 @@
 """Day 11 - Advent of Code"""
+import sys
 from collections import defaultdict
 from copy import deepcopy
-from typing import Dict, List, Tuple
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+from aoc.stats import HotPathStats  # noqa: E402
+
+STATS = HotPathStats()
 
 
 class Monkey:
@@ -36,6 +46,9 @@ class Monkey:
         num_inspections = len(self.items)
 
         for item in self.items:
+            if STATS.enabled:
+                STATS["eval_calls"] += 1
+
             new_worry_level = eval(self.update_fn.replace("old", str(item)))
             new_worry_level //= relief_factor
 
@@ -56,22 +69,37 @@ class Monkey:
 InputType = List[Monkey]
 
 
-def read_data(path: str) -> InputType:
-    with open(path, "r") as fin:
-        monkeys = [
-            Monkey(description)
-            for description in fin.read().split("\n\n")
-        ]
+def iter_monkey_descriptions(source: Source) -> Iterator[str]:
+    description = []
+
+    for line in iter_lines(source):
+        line = line.rstrip("\n")
+
+        if line:
+            description.append(line)
+        else:
+            yield "\n".join(description)
+            description = []
+
+    if description:
+        yield "\n".join(description)
+
+
+def read_data(source: Source) -> InputType:
+    monkeys = [
+        Monkey(description)
+        for description in iter_monkey_descriptions(source)
+    ]
 
-        factor_product = 1
+    factor_product = 1
 
-        for monkey in monkeys:
-            factor_product *= monkey.divisibility_factor
+    for monkey in monkeys:
+        factor_product *= monkey.divisibility_factor
 
-        for monkey in monkeys:
-            monkey.divisibility_factors_product = factor_product
+    for monkey in monkeys:
+        monkey.divisibility_factors_product = factor_product
 
-        return monkeys
+    return monkeys
 
 
 def execute_game(
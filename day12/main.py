@@ -3,21 +3,29 @@ from __future__ import annotations
 
 import heapq
 import sys
+from pathlib import Path
 from typing import Dict, List, Tuple
 
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+from aoc.stats import HotPathStats  # noqa: E402
+
 
 Position = Tuple[int, int]
 Adj = Dict[Position, List[Position]]
 Weights = Dict[Position, int]
 InputType = List[List[str]]
 
+STATS = HotPathStats()
+
 
-def read_data(path: str) -> InputType:
-    with open(path, "r") as fin:
-        return [
-            [height_character for height_character in line.strip()]
-            for line in fin.readlines()
-        ]
+def read_data(source: Source) -> InputType:
+    return [
+        [height_character for height_character in line.strip()]
+        for line in iter_lines(source)
+    ]
 
 
 def to_adj(data: InputType) -> Tuple[Adj, Weights]:
@@ -68,9 +76,15 @@ class NodePriorityQueue:
         self._nodes_pq = []
 
     def add(self, node: Position, weight: int):
+        if STATS.enabled:
+            STATS["heap_pushes"] += 1
+
         heapq.heappush(self._nodes_pq, (weight, node))
 
     def pop(self) -> Tuple[int, Position]:
+        if STATS.enabled:
+            STATS["heap_pops"] += 1
+
         return heapq.heappop(self._nodes_pq)
 
     def __len__(self) -> int:
@@ -1,22 +1,37 @@
 """Day 13 - Advent of Code"""
+import sys
 from copy import deepcopy
 from functools import cmp_to_key
+from pathlib import Path
 from typing import List, Tuple
 
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+from aoc.stats import HotPathStats  # noqa: E402
+
 Packet = list
 InputType = List[Tuple[Packet, Packet]]
 
+STATS = HotPathStats()
 
-def read_data(path: str) -> InputType:
+
+def read_data(source: Source) -> InputType:
     packets = []
-    with open(path, "r") as fin:
-        for packet_pair in fin.read().split("\n\n"):
-            p1, p2 = packet_pair.split("\n")
-            packets.append((eval(p1), eval(p2)))
+    lines = (line.strip() for line in iter_lines(source))
+    for p1 in lines:
+        if not p1:  # Blank line between pairs
+            continue
+        p2 = next(lines)
+        packets.append((eval(p1), eval(p2)))
     return packets
 
 
 def compare(left: Packet, right: Packet) -> int:
+    if STATS.enabled:
+        STATS["compare_calls"] += 1
+
     for l, r in zip(left, right):
         if isinstance(l, int) and isinstance(r, int):
             if l < r:
@@ -1,21 +1,32 @@
 """Day 14 - Advent of Code"""
-from typing import List, Set, Tuple
+import sys
+from pathlib import Path
+from typing import Iterator, List, Set, Tuple
+
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+from aoc.stats import HotPathStats  # noqa: E402
 
 Position = Tuple[int, int]
 RockLine = List[Position]
 InputType = List[RockLine]
 
+STATS = HotPathStats()
+
+
+def iter_rock_lines(source: Source) -> Iterator[RockLine]:
+    for line in iter_lines(source):
+        current_line = []
+        for position in line.strip().split(" -> "):
+            x, y = position.split(",")
+            current_line.append((int(x), int(y)))
+        yield current_line
 
-def read_data(path: str) -> InputType:
-    rock_lines = []
-    with open(path, "r") as fin:
-        for line in fin.readlines():
-            current_line = []
-            for position in line.strip().split(" -> "):
-                x, y = position.split(",")
-                current_line.append((int(x), int(y)))
-            rock_lines.append(current_line)
-    return rock_lines
+
+def read_data(source: Source) -> InputType:
+    return list(iter_rock_lines(source))
 
 
 def generate_all_rock_positions(rock_lines: InputType) -> Set[Position]:
@@ -73,7 +84,13 @@ def simulate(
     while True:
         x, y = source_pos
 
+        if STATS.enabled:
+            STATS["grains"] += 1
+
         while True:
+            if STATS.enabled:
+                STATS["grain_steps"] += 1
+
             new_x, new_y = _update_pos(x, y)
 
             if use_floor:
@@ -1,5 +1,12 @@
 """Day 15 - Advent of Code"""
-from typing import List, NamedTuple, Set, Tuple
+import sys
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Set, Tuple
+
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
 
 
 class Point(NamedTuple):
@@ -17,25 +24,30 @@ class Point(NamedTuple):
 
 InputType = List[Tuple[Point, Point]]
 
+# The example uses different puzzle parameters than the real input
+PART_KWARGS = {
+    "example.txt": ({"y": 10}, {"coordinate_max": 20}),
+}
+
+
+def iter_sensors(source: Source) -> Iterator[Tuple[Point, Point]]:
+    for line in iter_lines(source):
+        sensor, beacon = (
+            line
+            .strip()
+            .replace("Sensor at ", "")
+            .replace(": closest beacon is at", "")
+            .replace("x=", "")
+            .replace("y=", "")
+            .replace(", ", ",")
+            .split(" ")
+        )
 
-def read_data(path: str) -> InputType:
-    out = []
-    with open(path, "r") as fin:
-        for line in fin.readlines():
-            sensor, beacon = (
-                line
-                .strip()
-                .replace("Sensor at ", "")
-                .replace(": closest beacon is at", "")
-                .replace("x=", "")
-                .replace("y=", "")
-                .replace(", ", ",")
-                .split(" ")
-            )
+        yield Point.from_string(sensor), Point.from_string(beacon)
 
-            out.append((Point.from_string(sensor), Point.from_string(beacon)))
 
-    return out
+def read_data(source: Source) -> InputType:
+    return list(iter_sensors(source))
 
 
 def get_impossible_positions_at_y(data: InputType, y: int) -> Set[int]:
@@ -98,25 +110,28 @@ def find_distress_beacon_frequency(
                 return obp_x * 4_000_000 + obp_y
 
 
-def main():
-    data = read_data("data/example.txt")
-    assert len(get_impossible_positions_at_y(data, y=10)) == 26
-    assert find_distress_beacon_frequency(
+def solve_part_one(data: InputType, y: int = 2_000_000) -> int:
+    return len(get_impossible_positions_at_y(data, y=y))
+
+
+def solve_part_two(data: InputType, coordinate_max: int = 4_000_000) -> int:
+    return find_distress_beacon_frequency(
         data=data,
         coordinate_min=0,
-        coordinate_max=20,
-    ) == 56_000_011
+        coordinate_max=coordinate_max,
+    )
+
+
+def main():
+    data = read_data("data/example.txt")
+    assert solve_part_one(data, y=10) == 26
+    assert solve_part_two(data, coordinate_max=20) == 56_000_011
 
     for path in ("data/input.txt",):
         data = read_data(path)
 
-        solution_one = len(get_impossible_positions_at_y(data, y=2_000_000))
-
-        solution_two = find_distress_beacon_frequency(
-            data=data,
-            coordinate_min=0,
-            coordinate_max=4_000_000,
-        )
+        solution_one = solve_part_one(data)
+        solution_two = solve_part_two(data)
 
         print(
             f"File: {path}\n"
@@ -1,6 +1,13 @@
 """Day 18 - Advent of Code"""
+import sys
+from pathlib import Path
 from typing import List, NamedTuple, Set
 
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+
 
 class Point3D(NamedTuple):
     x: int
@@ -29,12 +36,11 @@ class ColoredPoint3D(Point3D):
 InputType = Set[Point3D]
 
 
-def read_data(path: str) -> InputType:
-    with open(path, "r") as fin:
-        return {
-            Point3D.from_string(line.strip())
-            for line in fin.readlines()
-        }
+def read_data(source: Source) -> InputType:
+    return {
+        Point3D.from_string(line.strip())
+        for line in iter_lines(source)
+    }
 
 
 def solve_part_one(data: InputType) -> int:
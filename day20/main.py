@@ -1,15 +1,24 @@
 """Day 20 - Advent of Code"""
+import sys
+from pathlib import Path
 from typing import List, Tuple
 
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+from aoc.stats import HotPathStats  # noqa: E402
+
 InputType = List[Tuple[int, int]]
 
+STATS = HotPathStats()
 
-def read_data(path: str) -> InputType:
-    with open(path, "r") as fin:
-        return [
-            (idx, int(number.strip()))
-            for idx, number in enumerate(fin.readlines())
-        ]
+
+def read_data(source: Source) -> InputType:
+    return [
+        (idx, int(number.strip()))
+        for idx, number in enumerate(iter_lines(source))
+    ]
 
 
 def mix(input_data: InputType, to_mix: InputType) -> InputType:
@@ -18,6 +27,10 @@ def mix(input_data: InputType, to_mix: InputType) -> InputType:
     for original_idx, original_value in input_data:
         idx = mixed.index((original_idx, original_value))
 
+        if STATS.enabled:
+            STATS["index_scans"] += 1
+            STATS["index_scanned_items"] += idx + 1
+
         del mixed[idx]
 
         new_idx = (idx + original_value) % len(mixed)
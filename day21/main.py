@@ -1,6 +1,13 @@
 """Day 21 - Advent of Code"""
+import sys
+from pathlib import Path
 from typing import Dict, Tuple
 
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+
 InputType = Dict[str, str]
 
 
@@ -103,12 +110,11 @@ class Div(ExprOp):
         return f"({self.left} / {self.right})"
 
 
-def read_data(path: str) -> InputType:
+def read_data(source: Source) -> InputType:
     monkeys = {}
-    with open(path, "r") as fin:
-        for line in fin.readlines():
-            name, expr = line.strip().split(": ")
-            monkeys[name] = expr
+    for line in iter_lines(source):
+        name, expr = line.strip().split(": ")
+        monkeys[name] = expr
     return monkeys
 
 
@@ -1,31 +1,44 @@
 """Day 22 - Advent of Code"""
+import sys
+from pathlib import Path
 from typing import List, Tuple, Union
 
+if not __package__:  # Run as a script, from the day directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.inputs import Source, iter_lines  # noqa: E402
+
 Map = List[List[str]]
 Instructions = List[Union[str, int]]
 InputType = Tuple[Map, Instructions]
 
 
-def read_data(path: str) -> InputType:
-    with open(path, "r") as fin:
-        _map, instructions = fin.read().split("\n\n")
+def read_data(source: Source) -> InputType:
+    lines = iter_lines(source)
 
-        _map = [list(row) for row in _map.split("\n")]
+    _map = []
+    for row in lines:
+        row = row.rstrip("\n")
+        if not row:  # Blank line after the map
+            break
+        _map.append(list(row))
 
-        # Pad all lines to the same length
-        max_len = max(len(row) for row in _map)
-        _map = [row + [" "] * (max_len - len(row)) for row in _map]
+    instructions = "".join(line.strip() for line in lines)
 
-        instructions = [
-            i if i in ("L", "R") else int(i)
-            for i in (
-                instructions
-                .replace("L", ",L,")
-                .replace("R", ",R,")
-                .split(",")
-            )
-        ]
-        return _map, instructions
+    # Pad all lines to the same length
+    max_len = max(len(row) for row in _map)
+    _map = [row + [" "] * (max_len - len(row)) for row in _map]
+
+    instructions = [
+        i if i in ("L", "R") else int(i)
+        for i in (
+            instructions
+            .replace("L", ",L,")
+            .replace("R", ",R,")
+            .split(",")
+        )
+    ]
+    return _map, instructions
 
 
 def solve_part_one(data: InputType) -> int: